@@ -0,0 +1,217 @@
+"""
+Statistical benchmarking of day solvers, with JSON baselines.
+
+Usage:
+
+    python -m aoc bench                       # every discovered day
+    python -m aoc bench 2025 --repeat 20 --output baseline.json
+    python -m aoc bench --compare baseline.json --threshold 0.15
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .io import load_input
+from .runner import _format_duration, _print_table, discover_days
+
+
+def _key(year: int, day: int, part: int) -> str:
+    return f"{year}/{day:02d}/part{part}"
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Return the q-th percentile (0..100) of samples using linear interpolation."""
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    pos = (len(ordered) - 1) * q / 100
+    lo, hi = math.floor(pos), math.ceil(pos)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """Summary statistics (in seconds) for a list of timing samples."""
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stddev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "p95": percentile(samples, 95),
+        "runs": len(samples),
+    }
+
+
+def measure(
+    func: Callable[[str], Any],
+    raw: str,
+    warmup: int = 1,
+    repeat: int = 5,
+    disable_gc: bool = False,
+) -> List[float]:
+    """Call func(raw) `warmup` times untimed, then `repeat` times timed."""
+    for _ in range(warmup):
+        func(raw)
+
+    samples: List[float] = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            if disable_gc:
+                gc.collect()
+                gc.disable()
+            t0 = time.perf_counter()
+            func(raw)
+            samples.append(time.perf_counter() - t0)
+            if disable_gc and gc_was_enabled:
+                gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+
+def bench_days(
+    days: Sequence[tuple],
+    warmup: int = 1,
+    repeat: int = 5,
+    disable_gc: bool = False,
+) -> Dict[str, Dict[str, float]]:
+    """Benchmark both parts of every (year, day) and return stats keyed by year/day/part."""
+    results: Dict[str, Dict[str, float]] = {}
+    for year, day in days:
+        module = import_module(f"aoc.year{year}.day{day:02d}")
+        raw = load_input(year, day)
+        if not raw:
+            print(f"[WARN] No input found for {year} day {day:02d}, skipping")
+            continue
+        for part in (1, 2):
+            solve = getattr(module, f"solve_part{part}", None)
+            if not callable(solve):
+                continue
+            try:
+                samples = measure(solve, raw, warmup, repeat, disable_gc)
+            except Exception as exc:
+                print(f"[ERROR] {_key(year, day, part)}: {exc}")
+                continue
+            results[_key(year, day, part)] = summarize(samples)
+    return results
+
+
+def compare(
+    current: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+    metric: str = "median",
+) -> List[str]:
+    """Return the keys whose `metric` got slower than baseline by more than `threshold`."""
+    return [
+        key
+        for key, stats in current.items()
+        if key in baseline and stats[metric] > baseline[key][metric] * (1 + threshold)
+    ]
+
+
+def print_results(
+    results: Dict[str, Dict[str, float]],
+    baseline: Optional[Dict[str, Dict[str, float]]] = None,
+    threshold: float = 0.1,
+) -> None:
+    headers = ("Day/Part", "Min", "Median", "Mean", "Stddev", "P95")
+    if baseline is not None:
+        headers += ("Baseline", "Change")
+
+    rows = []
+    for key, stats in results.items():
+        row = (key,) + tuple(
+            _format_duration(stats[m]) for m in ("min", "median", "mean", "stddev", "p95")
+        )
+        if baseline is not None:
+            if key in baseline:
+                ref = baseline[key]["median"]
+                change = (stats["median"] - ref) / ref if ref else 0.0
+                flag = " REGRESSION" if change > threshold else ""
+                row += (_format_duration(ref), f"{change:+.1%}{flag}")
+            else:
+                row += ("-", "new")
+        rows.append(row)
+    _print_table(rows, headers=headers)
+
+
+def write_baseline(path: Path, results: Dict[str, Dict[str, float]], args: argparse.Namespace) -> None:
+    payload = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "warmup": args.warmup,
+        "repeat": args.repeat,
+        "gc_disabled": args.no_gc,
+        "results": results,
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    print(f"[OK] Wrote baseline to {path}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="aoc bench",
+        description="Benchmark day solvers with repeated timings",
+    )
+    parser.add_argument("years", type=int, nargs="*", help="Years to benchmark (default: all)")
+    parser.add_argument("--days", type=int, nargs="+", metavar="DAY", help="Only these days")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per part (default: 1)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per part (default: 5)")
+    parser.add_argument("--no-gc", action="store_true", help="Disable the garbage collector while timing")
+    parser.add_argument("--output", type=Path, metavar="FILE", help="Write results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, metavar="FILE", help="Compare against a JSON baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative slowdown of the median flagged as a regression (default: 0.10)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1.")
+
+    days = discover_days(args.years or None)
+    if args.days:
+        days = [(y, d) for y, d in days if d in args.days]
+    if not days:
+        print("[WARN] No days found to benchmark.")
+        return 0
+
+    results = bench_days(days, args.warmup, args.repeat, args.no_gc)
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"]
+    print_results(results, baseline, args.threshold)
+
+    if args.output:
+        write_baseline(args.output, results, args)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"[WARN] {len(regressions)} regression(s) over {args.threshold:.0%}: "
+                  + ", ".join(regressions))
+            return 1
+        print("[OK] No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
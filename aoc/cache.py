@@ -0,0 +1,181 @@
+"""
+Persistent, content-addressed cache of puzzle answers.
+
+An answer is stored under a key derived from:
+  - the source of the day module and of every aoc module it imports
+    (directly or through another aoc module, relative imports included),
+  - the content of the input file (see aoc.io.input_path),
+  - the part number.
+
+Editing a day, one of its helpers or its input therefore invalidates it, while
+every other day is answered straight from disk. Entries are small JSON files;
+once the cache grows past its size bound the least recently used are evicted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from .io import input_path
+
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+_PACKAGE_ROOT = Path(__file__).resolve().parent
+
+
+def get_cache_root() -> Path:
+    env = os.getenv("AOC_CACHE_DIR")
+    if env:
+        return Path(env)
+    return Path(__file__).resolve().parents[1] / ".aoc_cache"
+
+
+def _source_path(module_name: str) -> Optional[Path]:
+    """Source file of an aoc module, found on disk without importing anything."""
+    parts = module_name.split(".")
+    if parts[0] != "aoc":
+        return None
+    base = _PACKAGE_ROOT.joinpath(*parts[1:])
+    for path in (base / "__init__.py", base.with_name(f"{base.name}.py")):
+        if path.is_file():
+            return path
+    return None
+
+
+def _aoc_imports(source: str, module_name: str, is_package: bool) -> Set[str]:
+    """Return the aoc modules (or names that may be modules) imported by a piece of source code."""
+    import ast  # only needed on a cache lookup, keep it off the startup path
+
+    package = module_name if is_package else module_name.rpartition(".")[0]
+    found: Set[str] = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            found.update(a.name for a in node.names if a.name == "aoc" or a.name.startswith("aoc."))
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package.rsplit(".", node.level - 1)[0] if node.level > 1 else package
+                base = f"{base}.{node.module}" if node.module else base
+            else:
+                base = node.module or ""
+            if base == "aoc" or base.startswith("aoc."):
+                found.add(base)
+                found.update(f"{base}.{a.name}" for a in node.names)
+    return found
+
+
+def code_hash(module_name: str) -> Optional[str]:
+    """Hash a module's source together with the aoc modules it depends on."""
+    digest = hashlib.sha256()
+    seen: Set[str] = set()
+    todo = [module_name]
+    while todo:
+        name = todo.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        path = _source_path(name)
+        if path is None:
+            if name == module_name:
+                return None
+            continue  # a name imported from a module, not a module itself
+        source = path.read_text(encoding="utf-8")
+        digest.update(name.encode() + b"\0" + source.encode() + b"\0")
+        todo.extend(sorted(_aoc_imports(source, name, path.name == "__init__.py")))
+    return digest.hexdigest()
+
+
+def file_hash(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+class AnswerCache:
+    """
+    On-disk answer cache with LRU eviction.
+
+    - `refresh=True` ignores existing entries (but still stores new answers).
+    - `hits` and `misses` count lookups, for reporting.
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        refresh: bool = False,
+    ):
+        self.root = root if root is not None else get_cache_root()
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self._code_hashes: Dict[str, Optional[str]] = {}
+
+    def key(self, year: int, day: int, part: int) -> Optional[str]:
+        """Return the cache key for a part, or None if its module or input is missing."""
+        module_name = f"aoc.year{year}.day{day:02d}"
+        if module_name not in self._code_hashes:
+            self._code_hashes[module_name] = code_hash(module_name)
+        code = self._code_hashes[module_name]
+        data = file_hash(input_path(year, day))
+        if code is None or data is None:
+            return None
+        return hashlib.sha256(f"{code}:{data}:{part}".encode()).hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, year: int, day: int, part: int) -> Optional[str]:
+        key = self.key(year, day, part)
+        entry = self._entry(key) if key else None
+        if entry is None or self.refresh or not entry.exists():
+            self.misses += 1
+            return None
+        try:
+            answer = json.loads(entry.read_text(encoding="utf-8"))["answer"]
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        os.utime(entry)  # mark as recently used
+        self.hits += 1
+        return answer
+
+    def put(self, year: int, day: int, part: int, answer: str) -> None:
+        key = self.key(year, day, part)
+        if key is None:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        entry = self._entry(key)
+        tmp = entry.with_suffix(".tmp")
+        payload = {"year": year, "day": day, "part": part, "answer": answer}
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, entry)
+        self.evict()
+
+    def evict(self) -> List[Path]:
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for path in self.root.glob("*.json"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed: List[Path] = []
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed.append(path)
+        return removed
+
+    def summary(self) -> str:
+        return f"[INFO] Cache: {self.hits} hit(s), {self.misses} miss(es) ({self.root})"
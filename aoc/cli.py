@@ -1,10 +1,13 @@
 import argparse
 import re
+import sys
 from datetime import date
 from importlib import import_module
 from typing import Optional
 
+from .cache import DEFAULT_MAX_BYTES, AnswerCache
 from .io import load_input
+from .runner import _print_table, solve_parts
 
 
 def extract_title_from_module(module) -> Optional[str]:
@@ -30,7 +33,21 @@ def extract_title_from_module(module) -> Optional[str]:
     return title or None
 
 
-def run_day(year: int, day: int) -> None:
+def run_day(
+    year: int,
+    day: int,
+    cache: Optional[AnswerCache] = None,
+    profile_top: Optional[int] = None,
+    mem_top: Optional[int] = None,
+) -> None:
+    """
+    Run both parts of a day and print the answers.
+
+    If `profile_top` is set, each part is profiled and the top functions printed
+    (see aoc.profiling). If `mem_top` is set, the peak memory of each part is
+    shown along with its `mem_top` largest allocation sites (see aoc.memory).
+    Both modes ignore cached answers.
+    """
     module_name = f"aoc.year{year}.day{day:02d}"
     try:
         module = import_module(module_name)
@@ -38,13 +55,41 @@ def run_day(year: int, day: int) -> None:
         print(f"[WARN] No module for year={year}, day={day:02d}")
         return
 
-    raw = load_input(year, day)
-    if not raw:
-        print(f"[WARN] No input found for {year} day {day:02d}")
-        return
+    profiler = None
+    if profile_top is not None:
+        from .profiling import PartProfiler
 
-    part1 = getattr(module, "solve_part1", None)
-    part2 = getattr(module, "solve_part2", None)
+        profiler = PartProfiler(f"{year}_day{day:02d}", top=profile_top)
+        cache = None
+
+    memory = None
+    if mem_top is not None:
+        from .memory import PartMemory
+
+        memory = PartMemory(top=mem_top)
+        cache = None
+
+    answers = {}
+    todo = []
+    for n in (1, 2):
+        cached = cache.get(year, day, n) if cache is not None else None
+        if cached is not None:
+            answers[f"Part {n}"] = f"{cached} (cached)"
+        else:
+            todo.append(n)
+
+    if todo:
+        raw = load_input(year, day)
+        if not raw:
+            print(f"[WARN] No input found for {year} day {day:02d}")
+            return
+
+        for label, answer, _ in solve_parts(
+            vars(module), raw, parts=todo, profiler=profiler, memory=memory
+        ):
+            answers[label] = answer
+            if cache is not None and label != "Parse" and not answer.startswith("ERROR"):
+                cache.put(year, day, int(label[-1]), answer)
 
     title = extract_title_from_module(module)
     if title:
@@ -53,19 +98,27 @@ def run_day(year: int, day: int) -> None:
         header = f"=== {year} Day {day:02d} ==="
 
     print(header)
-    if part1:
-        print("Part 1:", part1(raw))
-    else:
-        print("Part 1: (solve_part1 not implemented)")
-    if part2:
-        print("Part 2:", part2(raw))
-    else:
-        print("Part 2: (solve_part2 not implemented)")
+    for n in (1, 2):
+        print(f"Part {n}:", answers.get(f"Part {n}", f"(solve_part{n} not implemented)"))
 
+    if profiler is not None:
+        profiler.report()
+    if memory is not None:
+        # the shared parse step (if any) gets its own row next to the parts
+        labels = [label for label in ("Parse", "Part 1", "Part 2") if label in memory.usage]
+        _print_table([(label, *memory.columns(label)) for label in labels], headers=("Step", "Peak", "Blocks"))
+        memory.report()
 
-def run_year(year: int, max_day: int = 25) -> None:
+
+def run_year(
+    year: int,
+    max_day: int = 25,
+    cache: Optional[AnswerCache] = None,
+    profile_top: Optional[int] = None,
+    mem_top: Optional[int] = None,
+) -> None:
     for day in range(1, max_day + 1):
-        run_day(year, day)
+        run_day(year, day, cache, profile_top, mem_top)
         print()
 
 
@@ -80,10 +133,26 @@ def infer_december_day() -> tuple[int | None, int | None]:
     return None, None
 
 
+def _report_cache(cache: Optional[AnswerCache]) -> None:
+    if cache is not None and cache.hits + cache.misses:
+        print(cache.summary())
+
+
 def main() -> None:
+    # Subcommands are dispatched before parsing so that `aoc YEAR DAY` keeps working.
+    argv = sys.argv[1:]
+    if argv and argv[0] == "bench":
+        from .bench import main as bench_main
+
+        sys.exit(bench_main(argv[1:]))
+    if argv and argv[0] == "fetch":
+        from .fetch import main as fetch_main
+
+        sys.exit(fetch_main(argv[1:]))
+
     parser = argparse.ArgumentParser(
         prog="aoc",
-        description="Advent of Code runner",
+        description="Advent of Code runner (subcommands: bench, fetch)",
     )
     parser.add_argument("year", type=int, nargs="?", help="Year (e.g. 2025)")
     parser.add_argument("day", type=int, nargs="?", help="Day (1-25)")
@@ -92,8 +161,140 @@ def main() -> None:
         action="store_true",
         help="Run all days for the given year",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run each (day, part) on a pool of N worker processes",
+    )
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run each part in a worker process (implied by the options below)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Kill any part running longer than SECONDS (wall clock)",
+    )
+    parser.add_argument(
+        "--cpu-limit",
+        type=int,
+        default=None,
+        metavar="SECONDS",
+        help="Stop any part using more than SECONDS of CPU time",
+    )
+    parser.add_argument(
+        "--mem-limit",
+        type=int,
+        default=None,
+        metavar="MB",
+        help="Cap the address space of each worker process to MB megabytes",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the answer cache",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Recompute every answer and overwrite the cached ones",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_BYTES,
+        metavar="BYTES",
+        help="Evict least recently used cached answers beyond BYTES on disk",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile each part with cProfile (writes .pstats and collapsed stacks)",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=15,
+        metavar="N",
+        help="Number of functions listed per profile (default: 15)",
+    )
+    parser.add_argument(
+        "--mem",
+        action="store_true",
+        help="Show the peak memory and allocated blocks of each part (tracemalloc)",
+    )
+    parser.add_argument(
+        "--mem-top",
+        type=int,
+        default=None,
+        metavar="N",
+        help="With --mem (implied), list the N largest allocation sites per part",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="Report the CLI import time and fail if it exceeds --startup-budget",
+    )
+    parser.add_argument(
+        "--startup-budget",
+        type=float,
+        default=None,
+        metavar="MS",
+        help="Import time budget in milliseconds for --startup-report",
+    )
+
+    args = parser.parse_args(argv)
 
-    args = parser.parse_args()
+    if args.startup_report:
+        from .startup import DEFAULT_BUDGET_MS, report
+
+        budget = args.startup_budget if args.startup_budget is not None else DEFAULT_BUDGET_MS
+        sys.exit(report(budget))
+
+    profile_top = args.profile_top if args.profile else None
+    mem_top = args.mem_top if args.mem_top is not None else (0 if args.mem else None)
+    if profile_top is not None and mem_top is not None:
+        parser.error("--profile cannot be combined with --mem.")
+    isolated = (
+        args.isolate
+        or args.jobs > 1
+        or args.timeout is not None
+        or args.cpu_limit is not None
+        or args.mem_limit is not None
+    )
+    if isolated and (profile_top is not None or mem_top is not None):
+        parser.error("--profile and --mem cannot be combined with worker processes.")
+
+    cache = None
+    if not args.no_cache:
+        cache = AnswerCache(max_bytes=args.cache_size, refresh=args.refresh)
+
+    def run(year: int, day: Optional[int]) -> None:
+        """Run one day (or the whole year if day is None), isolated if requested."""
+        if isolated:
+            from .isolation import Limits
+            from .parallel import run_days_parallel, run_year_parallel
+
+            limits = Limits(
+                timeout=args.timeout,
+                cpu=args.cpu_limit,
+                memory=args.mem_limit * 1024 * 1024 if args.mem_limit is not None else None,
+            )
+            if day is None:
+                run_year_parallel(year, args.jobs, limits=limits, cache=cache)
+            else:
+                run_days_parallel(year, [day], args.jobs, limits=limits, cache=cache)
+        elif day is None:
+            run_year(year, cache=cache, profile_top=profile_top, mem_top=mem_top)
+        else:
+            run_day(year, day, cache, profile_top, mem_top)
+        _report_cache(cache)
 
     # Case 1: no args at all → try to auto-run today's puzzle in December
     if args.year is None and args.day is None and not args.all:
@@ -103,7 +304,7 @@ def main() -> None:
                 f"[INFO] No arguments provided, running today's puzzle: "
                 f"year={year}, day={day:02d}"
             )
-            run_day(year, day)
+            run(year, day)
             return
 
         parser.error(
@@ -115,11 +316,11 @@ def main() -> None:
     if args.all:
         if args.year is None:
             parser.error("You must provide a year when using --all.")
-        run_year(args.year)
+        run(args.year, None)
         return
 
     # Case 3: run a specific day
     if args.year is None or args.day is None:
         parser.error("You must provide both year and day, or use --all.")
 
-    run_day(args.year, args.day)
+    run(args.year, args.day)
@@ -0,0 +1,187 @@
+"""
+Prefetch missing puzzle inputs concurrently.
+
+Usage:
+
+    python -m aoc fetch 2025                  # every day with a module
+    python -m aoc fetch 2024 --days 1 2 3 --concurrency 2
+
+All downloads share one pooled HTTP session. Concurrency is bounded, request
+starts are spaced out to stay polite, transient failures (connection errors,
+429 and 5xx) are retried with exponential backoff, and each input is written
+atomically (see aoc.io.write_atomic).
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional, Sequence
+
+from .io import USER_AGENT, clear_session_token_cache, get_session_token, input_path, input_url, write_atomic
+from .runner import _format_duration, _print_table, discover_days
+
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class FetchResult(NamedTuple):
+    day: int
+    status: str  # OK, SKIPPED or FAILED
+    detail: str
+    attempts: int
+    elapsed: float
+
+
+class RateLimiter:
+    """Space out calls to `wait()` by at least `1 / rate` seconds, across threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def make_session(session_token: str, concurrency: int):
+    """A requests session with a connection pool sized for `concurrency` threads."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, concurrency))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    session.cookies.set("session", session_token)
+    return session
+
+
+def fetch_day(
+    session,
+    year: int,
+    day: int,
+    limiter: RateLimiter,
+    base_url: Optional[str] = None,
+    retries: int = 3,
+    backoff: float = 0.5,
+    timeout: float = 10.0,
+) -> FetchResult:
+    """Download one input, retrying transient failures, and write it atomically."""
+    import requests
+
+    t0 = time.perf_counter()
+    url = input_url(year, day, base_url)
+    detail = ""
+    for attempt in range(1, retries + 2):
+        if attempt > 1:
+            time.sleep(backoff * 2 ** (attempt - 2))
+        limiter.wait()
+        try:
+            response = session.get(url, timeout=timeout)
+        except requests.RequestException as exc:
+            detail = str(exc)
+            continue
+        if response.status_code == 200:
+            dest = input_path(year, day)
+            try:
+                write_atomic(dest, response.text.rstrip("\n"))
+            except OSError as exc:
+                return FetchResult(day, "FAILED", f"cannot write {dest}: {exc}", attempt, time.perf_counter() - t0)
+            return FetchResult(day, "OK", str(dest), attempt, time.perf_counter() - t0)
+        detail = f"HTTP {response.status_code}"
+        if response.status_code in (400, 401):  # expired or invalid session token
+            clear_session_token_cache()
+        if response.status_code not in RETRY_STATUSES:
+            break
+    return FetchResult(day, "FAILED", detail, attempt, time.perf_counter() - t0)
+
+
+def fetch_inputs(
+    year: int,
+    days: Sequence[int],
+    concurrency: int = 4,
+    rate: float = 2.0,
+    retries: int = 3,
+    backoff: float = 0.5,
+    base_url: Optional[str] = None,
+    session_token: Optional[str] = None,
+) -> List[FetchResult]:
+    """Download the inputs of `days` that are not on disk yet; return one result per day."""
+    results = [
+        FetchResult(day, "SKIPPED", "already on disk", 0, 0.0)
+        for day in days
+        if input_path(year, day).exists()
+    ]
+    missing = [day for day in days if not input_path(year, day).exists()]
+    if not missing:
+        return results
+
+    token = session_token or get_session_token()
+    if not token:
+        print("[WARN] AOC_SESSION not set, cannot download inputs.")
+        return sorted(results + [FetchResult(day, "FAILED", "no session token", 0, 0.0) for day in missing])
+
+    limiter = RateLimiter(rate)
+    with make_session(token, concurrency) as session, \
+            ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = [
+            pool.submit(fetch_day, session, year, day, limiter, base_url, retries, backoff)
+            for day in missing
+        ]
+        results.extend(f.result() for f in futures)
+
+    return sorted(results)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="aoc fetch",
+        description="Download missing puzzle inputs concurrently",
+    )
+    parser.add_argument("year", type=int, help="Year (e.g. 2025)")
+    parser.add_argument(
+        "--days",
+        type=int,
+        nargs="+",
+        metavar="DAY",
+        help="Days to fetch (default: every day that has a module)",
+    )
+    parser.add_argument("--concurrency", type=int, default=4, help="Parallel downloads (default: 4)")
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=2.0,
+        help="Maximum requests started per second (default: 2, 0 for no limit)",
+    )
+    parser.add_argument("--retries", type=int, default=3, help="Retries per input (default: 3)")
+    parser.add_argument("--base-url", default=None, help="Site to download from (default: AOC_BASE_URL)")
+    args = parser.parse_args(argv)
+
+    days = args.days or [day for year, day in discover_days([args.year])]
+    if not days:
+        parser.error(f"No day modules found for {args.year}, use --days.")
+
+    results = fetch_inputs(
+        args.year,
+        days,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        retries=args.retries,
+        base_url=args.base_url,
+    )
+    rows = [
+        (f"Day {r.day:02d}", r.status, r.detail, str(r.attempts), _format_duration(r.elapsed))
+        for r in results
+    ]
+    _print_table(rows, headers=("Day", "Status", "Detail", "Attempts", "Time"))
+    return 1 if any(r.status == "FAILED" for r in results) else 0
@@ -1,11 +1,27 @@
 from pathlib import Path
+import json
 import os
-from typing import Optional
+import time
+from typing import List, Optional, Tuple
 
-import requests
+# NOTE: requests and browser_cookie3 are imported inside the functions that
+# need them: most runs read inputs already on disk and should not pay for
+# loading the HTTP/cookie stack at startup (see aoc.startup).
 
 
-AOC_INPUT_URL = "https://adventofcode.com/{year}/day/{day}/input"
+AOC_BASE_URL = "https://adventofcode.com"
+AOC_INPUT_URL = "{base}/{year}/day/{day}/input"
+USER_AGENT = "github.com/dapitch666/AdventOfCode (Python AoC helper)"
+
+
+def get_base_url() -> str:
+    """Site to download from; AOC_BASE_URL points it elsewhere (e.g. a local test server)."""
+    return os.getenv("AOC_BASE_URL", AOC_BASE_URL).rstrip("/")
+
+
+def input_url(year: int, day: int, base_url: Optional[str] = None) -> str:
+    base = (base_url or get_base_url()).rstrip("/")
+    return AOC_INPUT_URL.format(base=base, year=year, day=day)
 
 
 def get_resources_root() -> Path:
@@ -26,56 +42,174 @@ def input_path(year: int, day: int) -> Path:
     return root / f"aoc{year}" / f"day{day}.txt"
 
 
-def get_session_token() -> Optional[str]:
+DEFAULT_BROWSERS = ("brave", "chrome", "firefox", "edge", "chromium")
+
+# Token resolved by get_session_token() in this process (see clear_session_token_cache).
+_resolved_token: Optional[str] = None
+
+
+def get_session_cache_path() -> Path:
+    env = os.getenv("AOC_SESSION_CACHE")
+    if env:
+        return Path(env)
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "aoc" / "session.json"
+
+
+def _session_cache_ttl() -> float:
+    """Seconds a token may be reused from disk; 0 (the default) keeps it in memory only."""
+    try:
+        return float(os.getenv("AOC_SESSION_CACHE_TTL", "0"))
+    except ValueError:
+        return 0.0
+
+
+def _read_session_cache() -> dict:
+    try:
+        return json.loads(get_session_cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_session_cache(data: dict) -> None:
+    """Write the cache file readable by its owner only (it may hold the token)."""
+    path = get_session_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # the cache is an optimisation only
+
+
+def browser_order(last: Optional[str] = None) -> List[str]:
     """
-    Try to retrieve the AoC session token.
+    Browsers to read the cookie from, in order.
 
-    Priority:
-    1. Try to read it from the browser using browser_cookie3.
-    2. Fallback to environment variable AOC_SESSION.
+    AOC_COOKIE_BROWSERS (e.g. "firefox,chrome") overrides the default order;
+    the browser that worked last time, if any, is always tried first.
     """
-    # 1) Try browser cookies
+    env = os.getenv("AOC_COOKIE_BROWSERS")
+    order = [b.strip().lower() for b in env.split(",") if b.strip()] if env else list(DEFAULT_BROWSERS)
+    if last in order:
+        order.remove(last)
+        order.insert(0, last)
+    return order
+
+
+def _token_from_browsers(order: List[str]) -> Tuple[Optional[str], Optional[str]]:
+    """Return (token, browser) from the first browser holding an AoC session cookie."""
     try:
         import browser_cookie3
-
-        # Tries multiple browser loaders
-        for loader in (
-                browser_cookie3.brave,
-                browser_cookie3.chrome,
-                browser_cookie3.firefox,
-                browser_cookie3.edge,
-                browser_cookie3.chromium,
-        ):
-            try:
-                if loader is None:
-                    continue
-
-                cj = loader(domain_name="adventofcode.com")
-                for cookie in cj:
-                    if cookie.name == "session":
-                        # Return the token immediately upon success
-                        return cookie.value
-            except Exception as e:
-                pass
     except ImportError:
-        pass
+        return None, None
+
+    for name in order:
+        loader = getattr(browser_cookie3, name, None)
+        if loader is None:
+            continue
+        try:
+            cj = loader(domain_name="adventofcode.com")
+            for cookie in cj:
+                if cookie.name == "session":
+                    return cookie.value, name
+        except Exception:
+            pass
+    return None, None
+
+
+def clear_session_token_cache() -> None:
+    """Forget the resolved token, in memory and on disk (e.g. after an HTTP 400)."""
+    global _resolved_token
+    _resolved_token = None
+    cached = _read_session_cache()
+    if "token" in cached:
+        _write_session_cache({k: v for k, v in cached.items() if k not in ("token", "saved")})
+
 
-    # 2) Fallback to environment variable
+def get_session_token() -> Optional[str]:
+    """
+    Try to retrieve the AoC session token.
+
+    Priority:
+    1. The token already resolved by this process.
+    2. The on-disk cache, if enabled with AOC_SESSION_CACHE_TTL and still fresh.
+    3. Try to read it from the browser using browser_cookie3, starting with the
+       browser that worked last time (see browser_order).
+    4. Fallback to environment variable AOC_SESSION.
+
+    Opening a browser's cookie database is slow (it is often encrypted), so the
+    result is kept for the rest of the process and bulk downloads pay it once.
+    """
+    global _resolved_token
+    if _resolved_token:
+        return _resolved_token
+
+    cached = _read_session_cache()
+    ttl = _session_cache_ttl()
+    if ttl > 0 and cached.get("token") and time.time() - cached.get("saved", 0) < ttl:
+        _resolved_token = cached["token"]
+        return _resolved_token
+
+    # Browser cookies
+    token, browser = _token_from_browsers(browser_order(cached.get("browser")))
+    if token:
+        entry = {"browser": browser}
+        if ttl > 0:
+            entry.update(token=token, saved=time.time())
+        _write_session_cache(entry)
+        _resolved_token = token
+        return token
+
+    # Fallback to environment variable
     env_token = os.getenv("AOC_SESSION")
     if env_token:
+        _resolved_token = env_token
         return env_token
 
     return None
 
 
+def write_atomic(dest: Path, text: str) -> None:
+    """
+    Write text to dest through a temporary file in the same directory.
+
+    The final rename is atomic, so an interrupted download never leaves a
+    truncated input behind that would later be mistaken for a complete one.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    # not mkstemp: its files are 0600, while opening with 0666 lets the kernel
+    # apply the current umask, as a plain open() would
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp = dest.parent / f".{dest.name}.{os.urandom(4).hex()}.part"
+        try:
+            fd = os.open(tmp, flags, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, dest)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
 def download_input(year: int, day: int, dest: Path) -> bool:
+    import requests
+
     session_token = get_session_token()
     if not session_token:
         print("[WARN] AOC_SESSION not set, cannot download input.")
         return False
 
-    url = AOC_INPUT_URL.format(year=year, day=day)
-    headers = {"User-Agent": "github.com/dapitch666/AdventOfCode (Python AoC helper)"}
+    url = input_url(year, day)
+    headers = {"User-Agent": USER_AGENT}
     cookies = {"session": session_token}
 
     try:
@@ -86,10 +220,11 @@ def download_input(year: int, day: int, dest: Path) -> bool:
 
     if response.status_code != 200:
         print(f"[ERROR] Failed to download input: HTTP {response.status_code}")
+        if response.status_code in (400, 401):  # expired or invalid session token
+            clear_session_token_cache()
         return False
 
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    dest.write_text(response.text.rstrip("\n"), encoding="utf-8")
+    write_atomic(dest, response.text.rstrip("\n"))
     print(f"[OK] Downloaded input to {dest}")
     return True
 
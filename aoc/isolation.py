@@ -0,0 +1,244 @@
+"""
+Run parts in reusable worker subprocesses with time and memory limits.
+
+A `WorkerPool` keeps up to N worker processes alive and feeds them tasks one at
+a time, so the cost of spawning a worker is paid once and not per day. Each
+task is bounded by:
+
+  - a wall-clock timeout: the worker is killed and replaced (TIMEOUT),
+  - a CPU time cap (RLIMIT_CPU): the kernel stops the worker (TIMEOUT),
+  - an address space cap (RLIMIT_AS): allocations past it raise MemoryError
+    inside the solver, or kill the worker (OOM).
+
+Whatever happens to a worker, the pool reports it in the task's result and
+carries on with the remaining tasks.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import signal
+import time
+from importlib import import_module
+from multiprocessing.connection import wait
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from .io import load_input
+from .runner import _extract_title
+
+try:
+    import resource
+except ImportError:  # not available on Windows: limits other than the timeout are ignored
+    resource = None
+
+
+class Task(NamedTuple):
+    year: int
+    day: int
+    part: int
+
+
+class TaskResult(NamedTuple):
+    task: Task
+    status: str  # OK, CACHED, ERROR, MISSING, NO INPUT, CRASH, TIMEOUT or OOM
+    answer: str
+    wall: float
+    cpu: float
+    title: Optional[str] = None
+
+
+class Limits(NamedTuple):
+    timeout: Optional[float] = None  # wall-clock seconds per task
+    cpu: Optional[int] = None  # CPU seconds per task
+    memory: Optional[int] = None  # address space of a worker, in bytes
+
+
+def _module_name(year: int, day: int) -> str:
+    return f"aoc.year{year}.day{day:02d}"
+
+
+def execute_task(task: Task) -> TaskResult:
+    """Run a single part in the current process and time it (wall and CPU)."""
+    module = import_module(_module_name(task.year, task.day))
+    title = _extract_title(module.__doc__ or "")
+
+    solve = getattr(module, f"solve_part{task.part}", None)
+    if not callable(solve):
+        return TaskResult(task, "MISSING", f"(solve_part{task.part} not implemented)", 0.0, 0.0, title)
+
+    raw = load_input(task.year, task.day)
+    if not raw:
+        return TaskResult(task, "NO INPUT", "(no input)", 0.0, 0.0, title)
+
+    # thread_time rather than process_time: once RLIMIT_CPU is armed, the
+    # process clock only advances on scheduler ticks and reads 0 for short parts
+    w0, c0 = time.perf_counter(), time.thread_time()
+    try:
+        answer, status = str(solve(raw)), "OK"
+    except MemoryError:
+        answer, status = "OOM (MemoryError)", "OOM"
+    except Exception as exc:
+        answer, status = f"ERROR: {exc}", "ERROR"
+    wall, cpu = time.perf_counter() - w0, time.thread_time() - c0
+    return TaskResult(task, status, answer, wall, cpu, title)
+
+
+def _apply_memory_limit(limit: Optional[int]) -> None:
+    if resource is None or limit is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _arm_cpu_limit(seconds: Optional[int]) -> None:
+    """RLIMIT_CPU counts the whole life of the worker: re-arm it for each task."""
+    if resource is None or seconds is None:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(usage.ru_utime + usage.ru_stime) + seconds
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(conn, limits: Limits) -> None:
+    """Worker loop: receive tasks until None (or the parent goes away)."""
+    _apply_memory_limit(limits.memory)
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        _arm_cpu_limit(limits.cpu)
+        conn.send(execute_task(task))
+    conn.close()
+
+
+def _context():
+    """Prefer fork (cheap start, inherits imports) where the platform offers it."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("fork" if "fork" in methods else None)
+
+
+class Worker:
+    """A worker process and the task it is currently running, if any."""
+
+    def __init__(self, ctx, limits: Limits):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, limits), daemon=True)
+        self.process.start()
+        child_conn.close()  # only the worker holds its end now
+        self.task: Optional[Task] = None
+        self.started = 0.0
+
+    def submit(self, task: Task) -> None:
+        self.task = task
+        self.started = time.perf_counter()
+        self.conn.send(task)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def close(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+
+def _death_result(worker: Worker, limits: Limits) -> TaskResult:
+    """Describe a task whose worker exited without answering."""
+    worker.process.join()
+    code = worker.process.exitcode
+    if code is not None and code < 0 and -code == getattr(signal, "SIGXCPU", None):
+        status, answer = "TIMEOUT", f"TIMEOUT (> {limits.cpu} s CPU)"
+    elif limits.memory is not None and code is not None and code < 0 and -code == signal.SIGKILL:
+        status, answer = "OOM", "OOM (worker killed)"
+    else:
+        status, answer = "CRASH", f"CRASH (exit code {code})"
+    return TaskResult(worker.task, status, answer, worker.elapsed(), 0.0)
+
+
+class WorkerPool:
+    """
+    A fixed number of reusable worker processes running tasks under `limits`.
+
+        with WorkerPool(4, Limits(timeout=60, memory=2 << 30)) as pool:
+            for result in pool.run(tasks):
+                ...
+    """
+
+    def __init__(self, size: int, limits: Limits = Limits()):
+        self.size = max(1, size)
+        self.limits = limits
+        self._ctx = _context()
+        self._idle: List[Worker] = []
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for worker in self._idle:
+            worker.close()
+        self._idle.clear()
+
+    def run(self, tasks: Iterable[Task]) -> Iterator[TaskResult]:
+        """Run tasks on the pool and yield their results as they finish."""
+        pending = list(tasks)
+        pending.reverse()
+        busy: Dict[object, Worker] = {}
+        timeout = self.limits.timeout
+
+        try:
+            while pending or busy:
+                while pending and len(busy) < self.size:
+                    worker = self._idle.pop() if self._idle else Worker(self._ctx, self.limits)
+                    worker.submit(pending.pop())
+                    busy[worker.conn] = worker
+
+                wait_for = None
+                if timeout is not None:
+                    oldest = max(worker.elapsed() for worker in busy.values())
+                    wait_for = max(0.0, timeout - oldest)
+
+                for conn in wait(list(busy), timeout=wait_for):
+                    worker = busy.pop(conn)
+                    try:
+                        result = conn.recv()
+                    except (EOFError, OSError):
+                        result = _death_result(worker, self.limits)
+                        worker.kill()
+                    else:
+                        if result.status == "OOM":
+                            worker.close()  # do not trust a worker that ran out of memory
+                        else:
+                            self._idle.append(worker)
+                    yield result
+
+                if timeout is not None:
+                    for conn, worker in list(busy.items()):
+                        if worker.elapsed() >= timeout:
+                            del busy[conn]
+                            worker.kill()
+                            yield TaskResult(
+                                worker.task, "TIMEOUT", f"TIMEOUT (> {timeout:g} s)", worker.elapsed(), 0.0
+                            )
+        finally:
+            for worker in busy.values():
+                worker.kill()
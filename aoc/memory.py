@@ -0,0 +1,143 @@
+"""
+tracemalloc integration for the runners (`--mem` / `--mem-top N`).
+
+For each part (and the shared parse step, if any) we record:
+
+  - the peak of traced memory allocated while it ran (exact),
+  - the number of blocks allocated by the part that were alive around that
+    peak, and the allocation sites responsible for them.
+
+The last two come from a snapshot taken whenever a Python function returns
+with traced memory 25% above the previous snapshot, so they describe the
+heaviest moment of the part at the cost of a few snapshots. Expect solvers to
+run several times slower in this mode.
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from .runner import _print_table
+
+
+_GROWTH = 1.25
+_MIN_SNAPSHOT_BYTES = 1024
+
+
+class MemoryUsage(NamedTuple):
+    peak: int
+    blocks: int
+    snapshot: Optional[tracemalloc.Snapshot]
+
+
+def format_bytes(size: float) -> str:
+    """Format a size in bytes in a human-friendly way."""
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.2f} GiB"
+
+
+def _short_path(filename: str) -> str:
+    """Show files of this project relative to it, others as they are."""
+    marker = "/aoc/"
+    idx = filename.replace("\\", "/").rfind(marker)
+    return filename[idx + 1:] if idx >= 0 else filename
+
+
+def _exclude_own_frames(snapshot: tracemalloc.Snapshot) -> tracemalloc.Snapshot:
+    return snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ))
+
+
+def trace_call(func: Callable[..., Any], *args: Any) -> tuple[Any, MemoryUsage]:
+    """Call func(*args) under tracemalloc and return (result, memory usage)."""
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        tracemalloc.stop()  # start from a clean slate: only trace this call
+    tracemalloc.start()
+
+    state = {"next": _MIN_SNAPSHOT_BYTES, "snapshot": None}
+
+    def on_event(frame, event, arg):
+        if event != "return":
+            return
+        current = tracemalloc.get_traced_memory()[0]
+        if current >= state["next"]:
+            state["snapshot"] = tracemalloc.take_snapshot()
+            state["next"] = current * _GROWTH
+
+    previous_hook = sys.getprofile()
+    sys.setprofile(on_event)
+    try:
+        result = func(*args)
+    finally:
+        sys.setprofile(previous_hook)
+        peak = tracemalloc.get_traced_memory()[1]
+        if state["snapshot"] is None:
+            state["snapshot"] = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        if was_tracing:
+            tracemalloc.start()
+
+    snapshot = _exclude_own_frames(state["snapshot"])
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    return result, MemoryUsage(peak, blocks, snapshot)
+
+
+class PartMemory:
+    """
+    Track memory of each part separately, then report the allocation sites.
+
+        memory = PartMemory(top=10)
+        solve_parts(globals(), raw, memory=memory)
+        memory.columns("Part 1")  # -> ("1.2 MiB", "3400")
+        memory.report()
+    """
+
+    def __init__(self, top: int = 0):
+        self.top = top
+        self.usage: Dict[str, MemoryUsage] = {}
+
+    def wrap(self, label: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Return func wrapped so that each call is measured under `label`."""
+
+        def measured(*args: Any) -> Any:
+            result, self.usage[label] = trace_call(func, *args)
+            return result
+
+        return measured
+
+    def columns(self, label: str) -> tuple[str, str]:
+        """(peak, blocks) cells for a table row, or dashes if `label` never ran."""
+        usage = self.usage.get(label)
+        if usage is None:
+            return "-", "-"
+        return format_bytes(usage.peak), f"{usage.blocks:,}"
+
+    def top_sites(self, label: str) -> List[tracemalloc.Statistic]:
+        usage = self.usage.get(label)
+        if usage is None or usage.snapshot is None:
+            return []
+        return usage.snapshot.statistics("lineno")[: self.top]
+
+    def report(self) -> None:
+        """Print the `top` allocation sites of each part, if requested."""
+        if not self.top:
+            return
+        for label in self.usage:
+            print(f"--- {label}: top {self.top} allocation sites at peak ---")
+            rows = [
+                (
+                    f"{_short_path(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+                    format_bytes(stat.size),
+                    f"{stat.count:,}",
+                )
+                for stat in self.top_sites(label)
+            ]
+            _print_table(rows, headers=("Site", "Size", "Blocks"))
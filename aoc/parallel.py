@@ -0,0 +1,124 @@
+"""
+Run Advent of Code parts in parallel on a pool of worker processes.
+
+Each (year, day, part) is a separate task for aoc.isolation.WorkerPool, so a
+solver that raises, crashes the interpreter, runs out of memory or never
+returns only affects its own row: the pool replaces the worker and keeps
+feeding it the remaining tasks, and the failure is reported in the table.
+"""
+
+from __future__ import annotations
+
+import time
+from importlib import import_module
+from importlib.util import find_spec
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .cache import AnswerCache
+from .isolation import Limits, Task, TaskResult, WorkerPool, _module_name
+from .runner import _extract_title, _format_duration, _print_table
+
+
+def day_exists(year: int, day: int) -> bool:
+    """Return True if a module exists for the given year and day."""
+    try:
+        return find_spec(_module_name(year, day)) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+def run_tasks(
+    tasks: Iterable[Task],
+    jobs: int,
+    timeout: Optional[float] = None,
+    limits: Optional[Limits] = None,
+) -> Iterator[TaskResult]:
+    """
+    Run tasks across at most `jobs` worker processes and yield results as they finish.
+
+    A worker that dies without answering yields a CRASH result, and one that runs
+    longer than `timeout` seconds (wall clock) is terminated and yields TIMEOUT.
+    `limits` can also cap the CPU time and memory of each task (see aoc.isolation).
+    """
+    limits = limits or Limits()
+    if timeout is not None:
+        limits = limits._replace(timeout=timeout)
+    with WorkerPool(jobs, limits) as pool:
+        yield from pool.run(tasks)
+
+
+def _print_day(year: int, day: int, results: List[TaskResult]) -> None:
+    title = next((r.title for r in results if r.title), None)
+    if title:
+        print(f"=== {year} Day {day:02d}: {title} ===")
+    else:
+        print(f"=== {year} Day {day:02d} ===")
+
+    rows = [
+        (f"Part {r.task.part}", r.answer, _format_duration(r.wall), _format_duration(r.cpu))
+        for r in sorted(results, key=lambda r: r.task.part)
+    ]
+    _print_table(rows, headers=("Part", "Answer", "Wall", "CPU"))
+
+
+def _cached_result(task: Task, cache: AnswerCache) -> Optional[TaskResult]:
+    answer = cache.get(task.year, task.day, task.part)
+    if answer is None:
+        return None
+    module = import_module(_module_name(task.year, task.day))
+    title = _extract_title(module.__doc__ or "")
+    return TaskResult(task, "CACHED", f"{answer} (cached)", 0.0, 0.0, title)
+
+
+def run_days_parallel(
+    year: int,
+    days: Sequence[int],
+    jobs: int,
+    limits: Limits = Limits(),
+    cache: Optional[AnswerCache] = None,
+) -> None:
+    """
+    Run both parts of the given days of `year` on a pool of `jobs` processes.
+
+    Days are printed in order: a day is flushed as soon as it and all the days
+    before it have finished, so the output reads the same as a serial run.
+    Parts found in `cache` are not scheduled at all.
+    """
+    tasks = [Task(year, day, part) for day in days for part in (1, 2)]
+    done: Dict[int, List[TaskResult]] = {day: [] for day in days}
+    to_print = list(days)
+
+    cached = []
+    if cache is not None:
+        cached = [r for r in (_cached_result(task, cache) for task in tasks) if r is not None]
+    cached_tasks = {r.task for r in cached}
+    to_run = [task for task in tasks if task not in cached_tasks]
+
+    t0 = time.perf_counter()
+    for result in chain(cached, run_tasks(to_run, jobs, limits=limits)):
+        done[result.task.day].append(result)
+        if cache is not None and result.status == "OK":
+            cache.put(year, result.task.day, result.task.part, result.answer)
+        while to_print and len(done[to_print[0]]) == 2:
+            day = to_print.pop(0)
+            _print_day(year, day, done[day])
+            print()
+
+    if len(days) > 1:
+        failed = sum(r.status not in ("OK", "CACHED", "MISSING") for rs in done.values() for r in rs)
+        elapsed = _format_duration(time.perf_counter() - t0)
+        print(f"[INFO] Ran {len(tasks)} parts of {len(days)} days with {jobs} jobs in {elapsed}"
+              f" ({failed} failed)")
+
+
+def run_year_parallel(
+    year: int,
+    jobs: int,
+    max_day: int = 25,
+    limits: Limits = Limits(),
+    cache: Optional[AnswerCache] = None,
+) -> None:
+    """Run every part of every existing day of `year` on a pool of `jobs` processes."""
+    days = [day for day in range(1, max_day + 1) if day_exists(year, day)]
+    run_days_parallel(year, days, jobs, limits, cache)
@@ -0,0 +1,133 @@
+"""
+cProfile integration for the runners (`--profile`).
+
+Each part (and the shared parse step, if any) is profiled separately. For
+every one of them we print the top functions by cumulative and by self time,
+and write two files:
+
+  - <prefix>_<part>.pstats     : raw cProfile data (pstats, snakeviz, ...)
+  - <prefix>_<part>.collapsed  : "a;b;c <µs>" lines for flamegraph tools
+                                 (flamegraph.pl, speedscope, inferno, ...)
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+
+DEFAULT_TOP = 15
+
+# pstats function key: (filename, line number, function name)
+FuncKey = Tuple[str, int, str]
+
+
+def get_profile_root() -> Path:
+    env = os.getenv("AOC_PROFILE_DIR")
+    if env:
+        return Path(env)
+    return Path(__file__).resolve().parents[1] / "profiles"
+
+
+def _label(func: FuncKey) -> str:
+    filename, line, name = func
+    if filename == "~":  # built-in functions
+        label = name
+    else:
+        label = f"{name} ({Path(filename).name}:{line})"
+    return label.replace(";", ",")
+
+
+def collapsed_stacks(stats: pstats.Stats, min_us: float = 1.0) -> List[str]:
+    """
+    Rebuild approximate call stacks from cProfile's caller/callee edges.
+
+    cProfile only records one level of callers, so the time of a function
+    called from several places is split between its stacks in proportion to
+    the time spent through each caller edge. Recursive edges are cut, and
+    stacks worth less than `min_us` microseconds are dropped.
+    """
+    raw: Dict[FuncKey, tuple] = stats.stats  # type: ignore[attr-defined]
+    children: Dict[FuncKey, List[Tuple[FuncKey, float]]] = {}
+    roots = []
+    for func, (_, _, _, _, callers) in raw.items():
+        known = [caller for caller in callers if caller in raw]
+        if not known:
+            roots.append(func)
+        for caller in known:
+            children.setdefault(caller, []).append((func, callers[caller][3]))
+
+    weights: Dict[str, float] = {}
+
+    def walk(func: FuncKey, path: Tuple[FuncKey, ...], share: float) -> None:
+        _, _, self_time, total_time, _ = raw[func]
+        stack = path + (func,)
+        own_us = self_time * share * 1e6
+        if own_us >= min_us:
+            key = ";".join(_label(f) for f in stack)
+            weights[key] = weights.get(key, 0.0) + own_us
+        for child, edge_time in children.get(func, ()):
+            child_total = raw[child][3]
+            if child in stack or child_total <= 0:
+                continue
+            child_share = share * edge_time / child_total
+            if child_total * child_share * 1e6 >= min_us:
+                walk(child, stack, min(child_share, 1.0))
+
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, 10_000))
+    try:
+        for root in roots:
+            walk(root, (), 1.0)
+    finally:
+        sys.setrecursionlimit(limit)
+
+    return [f"{stack} {round(us)}" for stack, us in sorted(weights.items()) if round(us) > 0]
+
+
+class PartProfiler:
+    """
+    Profile each part separately, then print and save the results.
+
+        profiler = PartProfiler("2024_day06")
+        solve_parts(globals(), raw, profiler=profiler)
+        profiler.report()
+    """
+
+    def __init__(self, prefix: str, out_dir: Path | None = None, top: int = DEFAULT_TOP):
+        self.prefix = prefix
+        self.out_dir = out_dir if out_dir is not None else get_profile_root()
+        self.top = top
+        self.profiles: Dict[str, cProfile.Profile] = {}
+
+    def wrap(self, label: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Return func wrapped so that each call is recorded under `label`."""
+
+        def profiled(*args: Any) -> Any:
+            profile = cProfile.Profile()
+            self.profiles[label] = profile
+            return profile.runcall(func, *args)
+
+        return profiled
+
+    def report(self) -> None:
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        for label, profile in self.profiles.items():
+            name = f"{self.prefix}_{label.lower().replace(' ', '')}"
+            stats = pstats.Stats(profile, stream=sys.stdout)
+
+            pstats_path = self.out_dir / f"{name}.pstats"
+            stats.dump_stats(pstats_path)
+            collapsed_path = self.out_dir / f"{name}.collapsed"
+            collapsed_path.write_text("\n".join(collapsed_stacks(stats)) + "\n", encoding="utf-8")
+
+            stats.strip_dirs()
+            for order, title in (("cumulative", "cumulative time"), ("tottime", "self time")):
+                print(f"--- {label}: top {self.top} functions by {title} ---")
+                stats.sort_stats(order).print_stats(self.top)
+
+            print(f"[OK] Wrote {pstats_path} and {collapsed_path}")
@@ -1,14 +1,38 @@
 from __future__ import annotations
 
+import argparse
+import copy
 from pathlib import Path
 import time
 import re
-from typing import Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from .io import load_input
+from .utils.solver import is_parsed_solver
+
+if TYPE_CHECKING:
+    from .memory import PartMemory
+    from .profiling import PartProfiler
 
 
 _TITLE_RE = re.compile(r"Advent of Code \d{4} - Day \d{2}: (.+)")
+_PACKAGE_ROOT = Path(__file__).resolve().parent
+
+
+def discover_days(years: Optional[Sequence[int]] = None) -> List[Tuple[int, int]]:
+    """
+    Return the sorted (year, day) pairs that have a module under aoc/yearYYYY/.
+
+    If `years` is given, only those years are scanned.
+    """
+    found: List[Tuple[int, int]] = []
+    for year_dir in _PACKAGE_ROOT.glob("year[0-9][0-9][0-9][0-9]"):
+        year = int(year_dir.name.replace("year", ""))
+        if years is not None and year not in years:
+            continue
+        for day_file in year_dir.glob("day[0-9][0-9].py"):
+            found.append((year, int(day_file.stem.replace("day", ""))))
+    return sorted(found)
 
 
 def _extract_title(doc: str) -> str | None:
@@ -36,22 +60,23 @@ def _format_duration(seconds: float) -> str:
     return f"{seconds:.3f} s"
 
 
-def _print_table(rows: List[Tuple[str, str, str]]) -> None:
-    """Print a simple ASCII table: (label, value, time)."""
+def _print_table(
+    rows: List[Tuple[str, ...]],
+    headers: Tuple[str, ...] = ("Part", "Answer", "Time"),
+) -> None:
+    """Print a simple ASCII table: one column per header (default: label, value, time)."""
     if not rows:
         return
 
-    headers = ("Part", "Answer", "Time")
     widths = [
-        max(len(headers[0]), max(len(row[0]) for row in rows)),
-        max(len(headers[1]), max(len(row[1]) for row in rows)),
-        max(len(headers[2]), max(len(row[2]) for row in rows)),
+        max(len(header), max(len(row[i]) for row in rows))
+        for i, header in enumerate(headers)
     ]
 
     def make_border() -> str:
         return "+" + "+".join("-" * (w + 2) for w in widths) + "+"
 
-    def format_row(cols: Tuple[str, str, str]) -> str:
+    def format_row(cols: Tuple[str, ...]) -> str:
         return "| " + " | ".join(col.ljust(w) for col, w in zip(cols, widths)) + " |"
 
     border = make_border()
@@ -63,7 +88,98 @@ def _print_table(rows: List[Tuple[str, str, str]]) -> None:
     print(border)
 
 
-def run_day_from_file(file: str, module_globals: Dict[str, Any]) -> None:
+def _timed(func: Callable[..., Any], *args: Any) -> Tuple[Any, float, bool]:
+    """Call func(*args) and return (result or error message, seconds, succeeded)."""
+    t0 = time.perf_counter()
+    try:
+        result, ok = func(*args), True
+    except Exception as exc:  # pragma: no cover (debug aid)
+        result, ok = f"ERROR: {exc}", False
+    return result, time.perf_counter() - t0, ok
+
+
+def solve_parts(
+    module_globals: Dict[str, Any],
+    raw: str,
+    parts: Sequence[int] = (1, 2),
+    profiler: Optional["PartProfiler"] = None,
+    memory: Optional["PartMemory"] = None,
+) -> List[Tuple[str, str, float]]:
+    """
+    Run the module's solve_partN for each of `parts` on `raw` and time each of them.
+
+    Return (label, answer, seconds) rows. Solvers decorated with
+    aoc.utils.solver.takes_parsed share a single call to the module's `parse`,
+    reported as its own "Parse" row; those declared as mutating their input get
+    a deep copy so that one part cannot corrupt the other's data.
+
+    With a `profiler` (see aoc.profiling), every timed call is also profiled;
+    with `memory` (see aoc.memory), its allocations are traced.
+    """
+    solvers = [(f"Part {n}", module_globals.get(f"solve_part{n}")) for n in parts]
+    solvers = [(label, solve) for label, solve in solvers if callable(solve)]
+    rows: List[Tuple[str, str, float]] = []
+
+    def run(label: str, func: Callable[..., Any], *args: Any) -> Tuple[Any, float, bool]:
+        if profiler is not None:
+            func = profiler.wrap(label, func)
+        if memory is not None:
+            func = memory.wrap(label, func)
+        return _timed(func, *args)
+
+    parsed, parse_ok = None, False
+    if any(is_parsed_solver(solve) for _, solve in solvers):
+        parsed, dt, parse_ok = run("Parse", module_globals["parse"], raw)
+        rows.append(("Parse", "-" if parse_ok else parsed, dt))
+
+    for label, solve in solvers:
+        if not is_parsed_solver(solve):
+            result, dt, _ = run(label, solve, raw)
+        elif not parse_ok:
+            result, dt = "ERROR: parse failed", 0.0
+        elif solve.mutates:
+            result, dt, _ = run(label, lambda: solve.solve_parsed(copy.deepcopy(parsed)))
+        else:
+            result, dt, _ = run(label, solve.solve_parsed, parsed)
+        rows.append((label, str(result), dt))
+
+    return rows
+
+
+def _parse_day_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    """Options understood by `python -m aoc.yearYYYY.dayDD`."""
+    parser = argparse.ArgumentParser(description="Run this day on its puzzle input")
+    parser.add_argument("--profile", action="store_true", help="Profile each part with cProfile")
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=15,
+        metavar="N",
+        help="Number of functions listed per profile (default: 15)",
+    )
+    parser.add_argument(
+        "--mem",
+        action="store_true",
+        help="Add peak memory and allocated blocks columns (tracemalloc)",
+    )
+    parser.add_argument(
+        "--mem-top",
+        type=int,
+        default=0,
+        metavar="N",
+        help="With --mem (implied), list the N largest allocation sites per part",
+    )
+    args = parser.parse_args(argv)
+    if args.profile and (args.mem or args.mem_top):
+        parser.error("--profile cannot be combined with --mem.")
+    return args
+
+
+def run_day_from_file(
+    file: str,
+    module_globals: Dict[str, Any],
+    argv: Optional[Sequence[str]] = None,
+) -> None:
     """
     Run a day module based on its file path.
 
@@ -72,15 +188,17 @@ def run_day_from_file(file: str, module_globals: Dict[str, Any]) -> None:
         if __name__ == "__main__":
             from aoc.runner import run_day_from_file
             run_day_from_file(__file__, globals())
+
+    Command line options (e.g. --profile) are read from `argv`, which defaults
+    to sys.argv[1:].
     """
+    args = _parse_day_args(argv)
     path = Path(file).resolve()
     year = int(path.parent.name.replace("year", ""))
     day = int(path.stem.replace("day", ""))
 
     raw = load_input(year, day)
 
-    solve_part1 = module_globals.get("solve_part1")
-    solve_part2 = module_globals.get("solve_part2")
     doc = module_globals.get("__doc__", "") or ""
     title = _extract_title(doc)
 
@@ -90,24 +208,30 @@ def run_day_from_file(file: str, module_globals: Dict[str, Any]) -> None:
         header = f"=== {year} Day {day:02d} ==="
     print(header)
 
-    rows: List[Tuple[str, str, str]] = []
-
-    if callable(solve_part1):
-        t0 = time.perf_counter()
-        try:
-            result = solve_part1(raw)
-        except Exception as exc:  # pragma: no cover (debug aid)
-            result = f"ERROR: {exc}"
-        dt = time.perf_counter() - t0
-        rows.append(("Part 1", str(result), _format_duration(dt)))
-
-    if callable(solve_part2):
-        t0 = time.perf_counter()
-        try:
-            result = solve_part2(raw)
-        except Exception as exc:  # pragma: no cover (debug aid)
-            result = f"ERROR: {exc}"
-        dt = time.perf_counter() - t0
-        rows.append(("Part 2", str(result), _format_duration(dt)))
-
-    _print_table(rows)
+    profiler = None
+    if args.profile:
+        from .profiling import PartProfiler
+
+        profiler = PartProfiler(f"{year}_day{day:02d}", top=args.profile_top)
+
+    memory = None
+    if args.mem or args.mem_top:
+        from .memory import PartMemory
+
+        memory = PartMemory(top=args.mem_top)
+
+    rows = []
+    for label, answer, dt in solve_parts(module_globals, raw, profiler=profiler, memory=memory):
+        row: Tuple[str, ...] = (label, answer, _format_duration(dt))
+        if memory is not None:
+            row += memory.columns(label)
+        rows.append(row)
+    headers: Tuple[str, ...] = ("Part", "Answer", "Time")
+    if memory is not None:
+        headers += ("Peak mem", "Blocks")
+    _print_table(rows, headers=headers)
+
+    if profiler is not None:
+        profiler.report()
+    if memory is not None:
+        memory.report()
@@ -0,0 +1,92 @@
+"""
+Measure the import cost of the CLI in a fresh interpreter.
+
+`aoc --startup-report` runs `python -X importtime -c "import aoc.cli"` in a
+subprocess, prints the slowest imports and fails (exit code 1) when the total
+goes over the budget or when the network stack gets imported eagerly.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Sequence
+
+from .runner import _format_duration, _print_table
+
+
+DEFAULT_BUDGET_MS = 100.0
+
+# Only needed to download inputs: must never be imported just to run a day.
+LAZY_MODULES = ("requests", "urllib3", "charset_normalizer", "browser_cookie3")
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportTiming]:
+    """Parse the `-X importtime` lines ("import time: self | cumulative | name")."""
+    timings: List[ImportTiming] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        timings.append(ImportTiming(name.strip(), int(fields[0]), int(fields[1]), depth))
+    return timings
+
+
+def measure_imports(target: str = "aoc.cli") -> List[ImportTiming]:
+    """Import `target` in a fresh interpreter and return its import timings."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def total_import_us(timings: Sequence[ImportTiming], prefix: str = "aoc") -> int:
+    """Cumulative import time of the top-level imports triggered by `prefix`."""
+    return sum(t.cumulative_us for t in timings if t.depth == 0 and t.module.split(".")[0] == prefix)
+
+
+def eager_lazy_modules(timings: Sequence[ImportTiming]) -> List[str]:
+    """Return the LAZY_MODULES that were imported anyway."""
+    imported = {t.module.split(".")[0] for t in timings}
+    return [name for name in LAZY_MODULES if name in imported]
+
+
+def report(budget_ms: float = DEFAULT_BUDGET_MS, top: int = 15) -> int:
+    timings = measure_imports()
+    by_module: Dict[str, ImportTiming] = {t.module: t for t in timings}
+    slowest = sorted(by_module.values(), key=lambda t: t.self_us, reverse=True)[:top]
+
+    rows = [
+        (t.module, _format_duration(t.self_us / 1e6), _format_duration(t.cumulative_us / 1e6))
+        for t in slowest
+    ]
+    _print_table(rows, headers=("Module", "Self", "Cumulative"))
+
+    total_ms = total_import_us(timings) / 1e3
+    print(f"[INFO] import aoc.cli: {total_ms:.1f} ms (budget {budget_ms:.1f} ms)")
+
+    status = 0
+    eager = eager_lazy_modules(timings)
+    if eager:
+        print(f"[ERROR] Network modules imported at startup: {', '.join(eager)}")
+        status = 1
+    if total_ms > budget_ms:
+        print(f"[ERROR] Startup import time over budget by {total_ms - budget_ms:.1f} ms")
+        status = 1
+    if status == 0:
+        print("[OK] Startup within budget.")
+    return status
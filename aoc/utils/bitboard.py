@@ -0,0 +1,138 @@
+"""
+Bitboards: a whole grid as one Python big integer, one bit per cell.
+
+Cell (y, x) is bit `y * stride + x`, with `guard` always-zero columns at the
+end of each row (stride = width + guard) so that shifting a board sideways
+never wraps a cell onto the next row. Python's big-int operations work on the
+whole grid at once, so one generation of a cellular automaton costs a handful
+of shifts, ANDs and XORs instead of an O(h·w) Python loop.
+
+Neighbour counts are kept bit-sliced: a list of "planes" where plane k holds
+bit k of every cell's count, built with ripple-carry adders over the shifted
+boards.
+
+    board = BitBoard(height, width)
+    rolls = board.from_lines(lines, "@")
+    crowded = board.at_least(board.neighbor_counts(rolls), 4)
+    stable, generations = run_until_fixpoint(rolls, lambda b: b & board.at_least(board.neighbor_counts(b), 4))
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+from aoc.utils.grid import DIRECTIONS_8
+
+
+class BitBoard:
+    """Geometry of a bitboard (size, stride and the mask of real cells)."""
+
+    __slots__ = ("height", "width", "guard", "stride", "full")
+
+    def __init__(self, height: int, width: int, guard: int = 1):
+        if guard < 1:
+            raise ValueError("A bitboard needs at least one guard column.")
+        self.height = height
+        self.width = width
+        self.guard = guard
+        self.stride = width + guard
+        # one row of ones repeated `height` times, built in a single int() call
+        self.full = int(("1" * width).rjust(self.stride, "0") * height, 2) if height and width else 0
+
+    def from_lines(self, lines: Iterable[Sequence[str]], on: str) -> int:
+        """Bitset of the cells of `lines` (strings or lists of chars) holding a char in `on`."""
+        table = {ord(c): "0" for c in map(chr, range(256))}
+        table.update({ord(c): "1" for c in on})
+        guard = "0" * self.guard
+        rows = ["".join(line).translate(table)[::-1] for line in lines]
+        bits = "".join(guard + row for row in reversed(rows))
+        return int(bits, 2) if bits else 0
+
+    def to_lines(self, bits: int, on: str = "#", off: str = ".") -> List[str]:
+        # one binary string for the whole board (cell 0 first), cut into rows
+        size = self.height * self.stride
+        text = format(bits & self.full, "b").zfill(size)[::-1].translate({ord("1"): on, ord("0"): off})
+        return [text[y * self.stride:y * self.stride + self.width] for y in range(self.height)]
+
+    def bit(self, y: int, x: int) -> int:
+        return 1 << (y * self.stride + x)
+
+    def cells(self, bits: int) -> Iterator[Tuple[int, int]]:
+        """Yield the (y, x) of every set cell, in row-major order."""
+        while bits:
+            low = bits & -bits
+            yield divmod(low.bit_length() - 1, self.stride)
+            bits ^= low
+
+    def shift(self, bits: int, dy: int, dx: int) -> int:
+        """Move every set cell by (dy, dx); cells leaving the grid are dropped."""
+        if abs(dx) > self.guard:
+            raise ValueError(f"Cannot shift by {dx} columns with {self.guard} guard column(s).")
+        offset = dy * self.stride + dx
+        moved = bits << offset if offset >= 0 else bits >> -offset
+        return moved & self.full
+
+    def neighbor_counts(self, bits: int, directions: Iterable[Tuple[int, int]] = DIRECTIONS_8) -> List[int]:
+        """
+        Bit-sliced count, for every cell, of its set neighbours in `directions`.
+
+        Returns planes p where bit (y, x) of p[k] is bit k of the count.
+        """
+        planes: List[int] = []
+        for dy, dx in directions:
+            # the neighbour at (y + dy, x + dx) lands on (y, x)
+            carry = self.shift(bits, -dy, -dx)
+            for k in range(len(planes)):
+                planes[k], carry = planes[k] ^ carry, planes[k] & carry
+                if not carry:
+                    break
+            if carry:
+                planes.append(carry)
+        return planes
+
+    def match(self, masks: Mapping[str, int], cells: Iterable[Tuple[int, int, str]]) -> int:
+        """
+        Cells (y, x) where a pattern anchored at (y, x) matches: for every
+        (dy, dx, ch) of `cells`, (y + dy, x + dx) is inside the grid and set in
+        masks[ch]. Needs |dx| <= guard.
+        """
+        found = self.full
+        for dy, dx, ch in cells:
+            found &= self.shift(masks.get(ch, 0), -dy, -dx)
+            if not found:
+                break
+        return found
+
+    def at_least(self, planes: Sequence[int], k: int) -> int:
+        """Cells whose bit-sliced count is >= k (a comparator over the planes, MSB first)."""
+        if k <= 0:
+            return self.full
+        greater, equal = 0, self.full
+        for b in reversed(range(max(len(planes), k.bit_length()))):
+            plane = planes[b] if b < len(planes) else 0
+            if k >> b & 1:
+                equal &= plane
+            else:
+                greater |= equal & plane
+                equal &= ~plane
+        return (greater | equal) & self.full
+
+
+def popcount(bits: int) -> int:
+    return bits.bit_count()
+
+
+def run_until_fixpoint(bits: int, step: Callable[[int], int], max_generations: int | None = None) -> Tuple[int, int]:
+    """
+    Apply `step` until the board stops changing.
+
+    Return (final board, number of generations that changed something).
+    """
+    generations = 0
+    while max_generations is None or generations < max_generations:
+        nxt = step(bits)
+        if nxt == bits:
+            break
+        bits = nxt
+        generations += 1
+    return bits, generations
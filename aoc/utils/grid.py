@@ -3,7 +3,7 @@ Utility functions for 2D grids used in Advent of Code puzzles.
 """
 
 from __future__ import annotations
-from typing import Iterable, Tuple, List
+from typing import Iterable, Iterator, Tuple, List
 
 
 # Common direction vectors (dy, dx)
@@ -66,3 +66,215 @@ def step(y: int, x: int, dy: int, dx: int, steps: int = 1) -> Tuple[int, int]:
     Useful for walking in a direction.
     """
     return y + dy * steps, x + dx * steps
+
+
+def _numpy():
+    """Import NumPy on first use, so that list-based days never pay for it."""
+    import numpy
+
+    return numpy
+
+
+class Grid:
+    """
+    A rectangular character grid backed by a 2D uint8 NumPy array.
+
+    Cells are stored as byte values (ord(ch)), which makes whole-grid
+    operations cheap: `mask("@")` gives a boolean array, `neighbor_count`
+    counts neighbours for every cell at once and `shifted` looks at the grid
+    from any offset. Indexing by row returns a str, so code written for the
+    List[str] grids of parse_grid (grid[y][x], len(grid), get(grid, y, x))
+    works unchanged.
+    """
+
+    __slots__ = ("cells",)
+
+    def __init__(self, cells):
+        np = _numpy()
+        self.cells = np.ascontiguousarray(cells, dtype=np.uint8)
+        if self.cells.ndim != 2:
+            raise ValueError("Grid cells must be a 2D array.")
+
+    @classmethod
+    def from_lines(cls, lines: List[str]) -> "Grid":
+        np = _numpy()
+        if not lines:
+            return cls(np.zeros((0, 0), dtype=np.uint8))
+        width = len(lines[0])
+        if any(len(line) != width for line in lines):
+            raise ValueError("Grid rows must all have the same length.")
+        data = "".join(lines).encode("latin-1")
+        return cls(np.frombuffer(data, dtype=np.uint8).reshape(len(lines), width).copy())
+
+    @classmethod
+    def from_raw(cls, raw: str) -> "Grid":
+        return cls.from_lines(parse_grid(raw))
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> str:
+        return self.cells[y].tobytes().decode("latin-1")
+
+    def __iter__(self) -> Iterator[str]:
+        for y in range(self.height):
+            yield self[y]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Grid) and _numpy().array_equal(self.cells, other.cells)
+
+    def get(self, y: int, x: int) -> str:
+        return chr(self.cells[y, x])
+
+    def in_bounds(self, y: int, x: int) -> bool:
+        return in_bounds(y, x, self.height, self.width)
+
+    def to_lines(self) -> List[str]:
+        return list(self)
+
+    def mask(self, chars: str):
+        """Boolean array, True where the cell is one of `chars`."""
+        np = _numpy()
+        codes = np.frombuffer(chars.encode("latin-1"), dtype=np.uint8)
+        if len(codes) == 1:
+            return self.cells == codes[0]
+        return np.isin(self.cells, codes)
+
+    def find(self, ch: str) -> List[Tuple[int, int]]:
+        """All (y, x) positions holding `ch`, in row-major order."""
+        ys, xs = self.mask(ch).nonzero()
+        return list(zip(ys.tolist(), xs.tolist()))
+
+    def shifted(self, array, dy: int, dx: int, fill=0):
+        """
+        Return `array` (grid-shaped) seen from offset (dy, dx):
+
+            result[y, x] == array[y + dy, x + dx]
+
+        with `fill` where (y + dy, x + dx) falls outside the grid. Pass
+        `self.cells` to shift the characters themselves.
+        """
+        np = _numpy()
+        pad = max(abs(dy), abs(dx))
+        if pad == 0:
+            return array
+        h, w = array.shape
+        padded = np.pad(array, pad, constant_values=fill)
+        return padded[pad + dy: pad + dy + h, pad + dx: pad + dx + w]
+
+    def neighbor_count(self, mask, directions: Iterable[Tuple[int, int]] = DIRECTIONS_8):
+        """
+        For every cell, count the neighbours (in `directions`) where `mask` is True.
+
+        Equivalent to a convolution with a 3×3 kernel: the mask is padded once
+        and each direction is added as a shifted view, so the cost is a few
+        array passes whatever the grid size.
+        """
+        np = _numpy()
+        h, w = mask.shape
+        padded = np.pad(mask.astype(np.uint8), 1)
+        counts = np.zeros((h, w), dtype=np.uint8)
+        for dy, dx in directions:
+            counts += padded[1 + dy: 1 + dy + h, 1 + dx: 1 + dx + w]
+        return counts
+
+
+SENTINEL = 0  # byte value of the border cells of a FlatGrid
+
+
+class FlatGrid:
+    """
+    A grid stored row by row in a single bytearray, surrounded by a border of
+    `pad` SENTINEL cells.
+
+    Cells are addressed by a linear index instead of (y, x): moving in a
+    direction is one integer addition (see `offset` and the precomputed
+    `offsets4`, `offsets8` and `diagonals`, in the same order as DIRECTIONS_4,
+    DIRECTIONS_8 and DIAGONALS), and the border makes bounds checks
+    unnecessary as long as a walk stops on a SENTINEL cell or takes at most
+    `pad` steps from an inside cell.
+
+        grid = FlatGrid.from_raw(raw)
+        for i in grid.indices():
+            if grid.cells[i] == ord("@"):
+                n = sum(grid.cells[i + o] == ord("@") for o in grid.offsets8)
+    """
+
+    __slots__ = ("cells", "height", "width", "pad", "stride", "offsets4", "offsets8", "diagonals")
+
+    def __init__(self, lines: List[str], pad: int = 1):
+        if pad < 1:
+            raise ValueError("FlatGrid needs a border of at least one cell.")
+        self.height = len(lines)
+        self.width = len(lines[0]) if lines else 0
+        self.pad = pad
+        self.stride = self.width + 2 * pad
+
+        border_rows = bytes(self.stride * pad)
+        side = bytes(pad)
+        parts = [border_rows]
+        for line in lines:
+            if len(line) != self.width:
+                raise ValueError("Grid rows must all have the same length.")
+            parts += (side, line.encode("latin-1"), side)
+        parts.append(border_rows)
+        self.cells = bytearray(b"".join(parts))
+
+        self.offsets4 = [self.offset(dy, dx) for dy, dx in DIRECTIONS_4]
+        self.offsets8 = [self.offset(dy, dx) for dy, dx in DIRECTIONS_8]
+        self.diagonals = [self.offset(dy, dx) for dy, dx in DIAGONALS]
+
+    @classmethod
+    def from_raw(cls, raw: str, pad: int = 1) -> "FlatGrid":
+        return cls(parse_grid(raw), pad)
+
+    def offset(self, dy: int, dx: int) -> int:
+        """Linear offset of one step in direction (dy, dx)."""
+        return dy * self.stride + dx
+
+    def index(self, y: int, x: int) -> int:
+        """Linear index of (y, x); (0, 0) is the top-left cell inside the border."""
+        return (y + self.pad) * self.stride + x + self.pad
+
+    def coords(self, i: int) -> Tuple[int, int]:
+        """(y, x) of a linear index (the inverse of `index`)."""
+        y, x = divmod(i, self.stride)
+        return y - self.pad, x - self.pad
+
+    def inside(self, i: int) -> bool:
+        """True if the linear index is a grid cell and not part of the border."""
+        y, x = self.coords(i)
+        return in_bounds(y, x, self.height, self.width)
+
+    def indices(self) -> Iterator[int]:
+        """Linear indices of every grid cell, in row-major order."""
+        for y in range(self.height):
+            start = self.index(y, 0)
+            yield from range(start, start + self.width)
+
+    def get(self, i: int) -> str:
+        return chr(self.cells[i])
+
+    def find(self, ch: str) -> List[int]:
+        """Linear indices of every cell holding `ch`, in row-major order."""
+        code = ord(ch)
+        found = []
+        i = self.cells.find(code)
+        while i != -1:
+            found.append(i)
+            i = self.cells.find(code, i + 1)
+        return found
+
+    def to_lines(self) -> List[str]:
+        return [
+            self.cells[self.index(y, 0): self.index(y, 0) + self.width].decode("latin-1")
+            for y in range(self.height)
+        ]
@@ -0,0 +1,114 @@
+"""
+Bulk integer extraction for puzzle inputs.
+
+Instead of splitting line by line and calling int() per token, the whole
+input is normalised with a few bytes-level passes (bytes.translate, plus some
+bytes.replace calls or NumPy passes when there are '-' characters) and converted in a
+single call: array('q', map(int, ...)) or, with numpy=True, NumPy's own text
+parser.
+
+    ints("1,2 -3\n4")                 -> array('q', [1, 2, -3, 4])
+    ints("3-5,10-12")                 -> array('q', [3, 5, 10, 12])   # '-' after a digit separates
+    ints_per_line("1 2\n3 4 5")       -> [array('q', [1, 2]), array('q', [3, 4, 5])]
+    ints_matrix("1,2\n3,4", cols=2)   -> numpy.array([[1, 2], [3, 4]])
+
+By default, anything that is not part of a number separates numbers, and a
+'-' is a sign only when it directly precedes a digit and does not follow one.
+`signed=False` treats every '-' as a separator. `sep` switches to strict
+mode: only `sep` and whitespace separate tokens, and anything else raises
+ValueError.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import List, Optional, Union
+
+Text = Union[str, bytes]
+
+_DIGITS = [bytes([c]) for c in b"0123456789"]
+_KEEP = b"0123456789\n"
+# every byte that is not part of a number (or a line break) becomes a space
+_UNSIGNED = bytes(c if c in _KEEP else 0x20 for c in range(256))
+_SIGNED = bytes(c if c in _KEEP + b"-" else 0x20 for c in range(256))
+
+
+def _bytes(raw: Text) -> bytes:
+    return raw.encode() if isinstance(raw, str) else bytes(raw)
+
+
+def _normalise(raw: Text, signed: bool, sep: Optional[str], numpy: bool = False) -> bytes:
+    """Bytes holding only the numbers of `raw`, separated by whitespace."""
+    data = _bytes(raw)
+    if sep is not None:
+        return data.replace(sep.encode(), b" ") if sep else data
+    if not signed:
+        return data.translate(_UNSIGNED)
+    data = data.translate(_SIGNED)
+    if b"-" not in data:
+        return data
+    return _drop_minus_numpy(data) if numpy else _drop_minus(data)
+
+
+def _drop_minus(data: bytes) -> bytes:
+    """
+    Blank every '-' that follows a digit or is not followed by one, in bytes
+    holding only digits, '-', spaces and line breaks (bytes.replace is much
+    faster than a regex with a lookbehind on large inputs).
+    """
+    for digit in _DIGITS:
+        data = data.replace(digit + b"-", digit + b" ")
+    while b"--" in data:
+        data = data.replace(b"--", b" -")
+    data = data.replace(b"- ", b"  ").replace(b"-\n", b" \n")
+    return data[:-1] if data.endswith(b"-") else data
+
+
+def _drop_minus_numpy(data: bytes) -> bytes:
+    """Same as _drop_minus, with a few vectorised passes over the bytes."""
+    import numpy as np
+
+    chars = np.frombuffer(data, dtype=np.uint8).copy()
+    digit = (chars >= ord("0")) & (chars <= ord("9"))
+    after_digit = np.zeros_like(digit)
+    after_digit[1:] = digit[:-1]
+    before_digit = np.zeros_like(digit)
+    before_digit[:-1] = digit[1:]
+    chars[(chars == ord("-")) & (after_digit | ~before_digit)] = ord(" ")
+    return chars.tobytes()
+
+
+def _convert(data: bytes, numpy: bool, strict: bool):
+    if not numpy:
+        return array("q", map(int, data.split()))
+    import numpy as np
+
+    if strict:
+        # int() validates every token; the array buffer is shared, not copied
+        return np.frombuffer(array("q", map(int, data.split())), dtype=np.int64)
+    if not data.strip():
+        return np.zeros(0, dtype=np.int64)
+    return np.fromstring(data, dtype=np.int64, sep=" ")
+
+
+def ints(raw: Text, signed: bool = True, sep: Optional[str] = None, numpy: bool = False):
+    """Every integer of `raw`, in order, as an array('q') (or a 1D int64 NumPy array)."""
+    return _convert(_normalise(raw, signed, sep, numpy), numpy, sep is not None)
+
+
+def ints_per_line(raw: Text, signed: bool = True, sep: Optional[str] = None, numpy: bool = False) -> List:
+    """The integers of each non-blank line of `raw`, one array per line."""
+    data = _normalise(raw, signed, sep, numpy)
+    return [_convert(line, numpy, sep is not None) for line in data.splitlines() if line.strip()]
+
+
+def ints_matrix(raw: Text, cols: int, signed: bool = True, sep: Optional[str] = None):
+    """
+    The integers of `raw` as a NumPy int64 array of shape (n, cols), for
+    inputs holding a fixed number of integers per record (not necessarily
+    one record per line).
+    """
+    values = ints(raw, signed=signed, sep=sep, numpy=True)
+    if len(values) % cols:
+        raise ValueError(f"Found {len(values)} integers, not a multiple of {cols} columns.")
+    return values.reshape(-1, cols)
@@ -0,0 +1,272 @@
+"""
+Shortest-path searches (BFS, 0-1 BFS, Dijkstra, A*) over grids and graphs.
+
+The searches work on integer node ids and keep their state in flat arrays
+(distance and predecessor per id) instead of dicts keyed by tuples. A graph
+only has to provide:
+
+    size             number of node ids (ids are 0 <= i < size)
+    id(node)         node -> id
+    node(i)          id -> node
+    neighbors(i)     ids reachable in one step (for bfs)
+    edges(i)         (id, weight) pairs (for bfs_01, dijkstra and astar)
+
+Two graphs are provided: `GridGraph`, over a FlatGrid (nodes are (y, x) and
+ids are the grid's linear indices), and `AdjacencyGraph`, over a dict mapping
+each node to its neighbours (or to a dict of neighbour -> weight).
+
+    graph = GridGraph(FlatGrid.from_raw(raw), walls="#")
+    result = bfs(graph, (0, 0), goal=(h - 1, w - 1))
+    result.distance((h - 1, w - 1)), result.path((h - 1, w - 1))
+
+Every search stops as soon as `goal` is settled, if one is given.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections import deque
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from aoc.utils.grid import DIRECTIONS_4, FlatGrid
+
+
+UNREACHED = -1
+
+
+class SearchResult:
+    """Distances and predecessors found by a search, indexed by node id."""
+
+    __slots__ = ("graph", "dist", "prev", "goal")
+
+    def __init__(self, graph, dist: array, prev: array, goal: Optional[int]):
+        self.graph = graph
+        self.dist = dist
+        self.prev = prev
+        self.goal = goal  # id of the goal, if the search reached it
+
+    @property
+    def found(self) -> bool:
+        return self.goal is not None
+
+    def distance(self, node) -> Optional[int]:
+        """Distance from the start to `node`, or None if it was not reached."""
+        d = self.dist[self.graph.id(node)]
+        return None if d == UNREACHED else d
+
+    def path(self, node=None) -> List:
+        """Nodes from the start to `node` (default: the goal), or [] if it was not reached."""
+        i = self.goal if node is None else self.graph.id(node)
+        if i is None or self.dist[i] == UNREACHED:
+            return []
+        ids = []
+        while i != UNREACHED:
+            ids.append(i)
+            i = self.prev[i]
+        ids.reverse()
+        return [self.graph.node(i) for i in ids]
+
+
+class GridGraph:
+    """
+    The open cells of a FlatGrid as a graph: nodes are (y, x), ids are linear
+    indices and moves follow `directions` (one step each, so the grid border
+    keeps every move inside the buffer).
+
+    `costs` maps a cell character to the weight of entering that cell
+    (default 1 for every open cell).
+    """
+
+    def __init__(
+        self,
+        grid: FlatGrid,
+        walls: str = "#",
+        directions: Sequence[Tuple[int, int]] = DIRECTIONS_4,
+        costs: Optional[Mapping[str, int]] = None,
+    ):
+        self.grid = grid
+        self.size = len(grid.cells)
+        self.offsets = tuple(grid.offset(dy, dx) for dy, dx in directions)
+        blocked = {ord(c) for c in walls}
+        # per cell: 0 for walls and the border, else 1 + the cost of entering it
+        weight = bytearray(256)
+        for b in range(1, 256):
+            if b not in blocked:
+                weight[b] = 2
+        for c, cost in (costs or {}).items():
+            if not 0 <= cost < 255:
+                raise ValueError(f"Cost of {c!r} must be in [0, 254], got {cost}.")
+            weight[ord(c)] = cost + 1
+        weight[0] = 0  # SENTINEL border
+        self.weight = grid.cells.translate(weight)
+
+    def id(self, node: Tuple[int, int]) -> int:
+        return self.grid.index(*node)
+
+    def node(self, i: int) -> Tuple[int, int]:
+        return self.grid.coords(i)
+
+    def neighbors(self, i: int) -> List[int]:
+        weight = self.weight
+        return [j for o in self.offsets if weight[j := i + o]]
+
+    def edges(self, i: int) -> Iterator[Tuple[int, int]]:
+        weight = self.weight
+        for o in self.offsets:
+            w = weight[i + o]
+            if w:
+                yield i + o, w - 1
+
+    def manhattan(self, goal: Tuple[int, int]) -> Callable[[int], int]:
+        """A* heuristic: Manhattan distance to `goal` (admissible for 4 directions and costs >= 1)."""
+        gy, gx = goal
+        pad, stride = self.grid.pad, self.grid.stride
+
+        def h(i: int) -> int:
+            y, x = divmod(i, stride)
+            return abs(y - pad - gy) + abs(x - pad - gx)
+
+        return h
+
+
+class AdjacencyGraph:
+    """
+    A graph given as {node: neighbours}, where neighbours is an iterable of
+    nodes (every edge has weight 1) or a {neighbour: weight} mapping. Nodes
+    that only appear as neighbours are included.
+    """
+
+    def __init__(self, adjacency: Mapping[Hashable, Union[Iterable[Hashable], Mapping[Hashable, int]]]):
+        self.nodes: List[Hashable] = []
+        self.ids: Dict[Hashable, int] = {}
+        targets = []
+        for src, dsts in adjacency.items():
+            weighted = dsts.items() if isinstance(dsts, Mapping) else ((dst, 1) for dst in dsts)
+            targets.append((self._intern(src), [(self._intern(dst), w) for dst, w in weighted]))
+        self._edges: List[List[Tuple[int, int]]] = [[] for _ in self.nodes]
+        self._neighbors: List[List[int]] = [[] for _ in self.nodes]
+        for i, out in targets:
+            self._edges[i] = out
+            self._neighbors[i] = [j for j, _ in out]
+        self.size = len(self.nodes)
+
+    def _intern(self, node: Hashable) -> int:
+        i = self.ids.get(node)
+        if i is None:
+            i = self.ids[node] = len(self.nodes)
+            self.nodes.append(node)
+        return i
+
+    def id(self, node: Hashable) -> int:
+        return self.ids[node]
+
+    def node(self, i: int) -> Hashable:
+        return self.nodes[i]
+
+    def neighbors(self, i: int) -> List[int]:
+        return self._neighbors[i]
+
+    def edges(self, i: int) -> List[Tuple[int, int]]:
+        return self._edges[i]
+
+
+def _buffers(graph) -> Tuple[array, array]:
+    return array("q", [UNREACHED]) * graph.size, array("q", [UNREACHED]) * graph.size
+
+
+def _goal_id(graph, goal) -> int:
+    return UNREACHED if goal is None else graph.id(goal)
+
+
+def bfs(graph, start, goal=None) -> SearchResult:
+    """Unweighted shortest paths from `start` (edges count as 1)."""
+    dist, prev = _buffers(graph)
+    target = _goal_id(graph, goal)
+    neighbors = graph.neighbors
+
+    s = graph.id(start)
+    dist[s] = 0
+    if s == target:
+        return SearchResult(graph, dist, prev, target)
+    frontier = [s]
+    d = 0
+    while frontier:
+        d += 1
+        following = []
+        for i in frontier:
+            for j in neighbors(i):
+                if dist[j] == UNREACHED:
+                    dist[j] = d
+                    prev[j] = i
+                    if j == target:
+                        return SearchResult(graph, dist, prev, target)
+                    following.append(j)
+        frontier = following
+    return SearchResult(graph, dist, prev, None)
+
+
+def bfs_01(graph, start, goal=None) -> SearchResult:
+    """Shortest paths when every edge weighs 0 or 1 (a deque instead of a heap)."""
+    dist, prev = _buffers(graph)
+    target = _goal_id(graph, goal)
+    edges = graph.edges
+    done = bytearray(graph.size)
+
+    s = graph.id(start)
+    dist[s] = 0
+    queue = deque([s])
+    while queue:
+        i = queue.popleft()
+        if done[i]:
+            continue
+        if i == target:
+            return SearchResult(graph, dist, prev, target)
+        done[i] = 1
+        d = dist[i]
+        for j, w in edges(i):
+            nd = d + w
+            if dist[j] == UNREACHED or nd < dist[j]:
+                dist[j] = nd
+                prev[j] = i
+                if w:
+                    queue.append(j)
+                else:
+                    queue.appendleft(j)
+    return SearchResult(graph, dist, prev, None)
+
+
+def astar(graph, start, goal=None, heuristic: Optional[Callable[[int], int]] = None) -> SearchResult:
+    """
+    A* from `start` to `goal` with an admissible, consistent `heuristic` over
+    node ids (see GridGraph.manhattan). Without a heuristic this is Dijkstra.
+    """
+    dist, prev = _buffers(graph)
+    target = _goal_id(graph, goal)
+    edges = graph.edges
+    done = bytearray(graph.size)
+    h = heuristic or (lambda i: 0)
+
+    s = graph.id(start)
+    dist[s] = 0
+    heap = [(h(s), s)]
+    while heap:
+        _, i = heapq.heappop(heap)
+        if done[i]:
+            continue
+        if i == target:
+            return SearchResult(graph, dist, prev, target)
+        done[i] = 1
+        d = dist[i]
+        for j, w in edges(i):
+            nd = d + w
+            if dist[j] == UNREACHED or nd < dist[j]:
+                dist[j] = nd
+                prev[j] = i
+                heapq.heappush(heap, (nd + h(j), j))
+    return SearchResult(graph, dist, prev, None)
+
+
+def dijkstra(graph, start, goal=None) -> SearchResult:
+    """Shortest paths with non-negative edge weights."""
+    return astar(graph, start, goal)
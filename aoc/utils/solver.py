@@ -0,0 +1,45 @@
+"""
+Helpers for day solvers that share a single parsed input between both parts.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Callable
+
+
+def takes_parsed(func: Callable | None = None, *, mutates: bool = False):
+    """
+    Mark a solver as working on the result of the module's `parse(raw)`.
+
+    The decorated function still accepts the raw puzzle input: it then calls
+    `parse` itself, so tests and direct callers are unaffected. The runner
+    instead parses once and calls `solver.solve_parsed(parsed)` for each part.
+    Solvers that modify their input must say so with `mutates=True`; they are
+    handed a deep copy so the other part still sees pristine data.
+
+        @takes_parsed
+        def solve_part1(points): ...
+
+        @takes_parsed(mutates=True)
+        def solve_part2(grid): ...
+    """
+
+    def decorate(solve: Callable) -> Callable:
+        @functools.wraps(solve)
+        def wrapper(raw: str, *args: Any, **kwargs: Any) -> Any:
+            parse = solve.__globals__["parse"]
+            return solve(parse(raw), *args, **kwargs)
+
+        wrapper.solve_parsed = solve
+        wrapper.mutates = mutates
+        return wrapper
+
+    if func is not None:
+        return decorate(func)
+    return decorate
+
+
+def is_parsed_solver(solve: Any) -> bool:
+    """Return True if `solve` was decorated with `takes_parsed`."""
+    return callable(getattr(solve, "solve_parsed", None))
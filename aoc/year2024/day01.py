@@ -1,27 +1,45 @@
 """Advent of Code 2024 - Day 01: Historian Hysteria."""
-from collections import Counter
-from typing import Tuple, List
-
-
-def parse(raw: str) -> Tuple[List[int], List[int]]:
-    lefts, rights = [], []
-    for line in raw.splitlines():
-        left, right = map(int, line.split())
-        lefts.append(left)
-        rights.append(right)
-    return lefts, rights
-
-
-def solve_part1(raw: str):
-    lefts, rights = parse(raw)
-    ls, rs = sorted(lefts), sorted(rights)
-    return sum(abs(r - l) for l, r in zip(ls, rs))
-
-
-def solve_part2(raw: str):
-    lefts, rights = parse(raw)
-    lc, rc = Counter(lefts), Counter(rights)
-    return sum(n * lc[n] * rc[n] for n in lc)
+import numpy as np
+
+from aoc.utils.parse import ints_matrix
+from aoc.utils.solver import takes_parsed
+
+
+def parse(raw: str) -> tuple[np.ndarray, np.ndarray]:
+    columns = ints_matrix(raw, cols=2, signed=False)
+    return columns[:, 0], columns[:, 1]
+
+
+@takes_parsed
+def solve_part1(data: tuple[np.ndarray, np.ndarray]):
+    lefts, rights = data
+    return int(np.abs(np.sort(lefts) - np.sort(rights)).sum())
+
+
+@takes_parsed
+def solve_part2(data: tuple[np.ndarray, np.ndarray]):
+    lefts, rights = data
+    return similarity(lefts, rights)
+
+
+def similarity(values: np.ndarray, pool: np.ndarray) -> int:
+    """Sum of each of `values` times the number of its occurrences in `pool`."""
+    if not len(values) or not len(pool):
+        return 0
+    top = int(max(values.max(), pool.max()))
+    if top < 4 * len(pool) + (1 << 16):
+        # small value range: counting sort
+        counts = np.bincount(pool, minlength=top + 1)[values]
+    else:
+        # sorted queries keep the binary searches cache friendly
+        values = np.sort(values)
+        distinct, tally = np.unique(pool, return_counts=True)
+        at = np.minimum(np.searchsorted(distinct, values), len(distinct) - 1)
+        counts = np.where(distinct[at] == values, tally[at], 0)
+    if int(np.abs(values).max()) * len(pool) * len(values) >= 1 << 63:
+        # the int64 sum could overflow: accumulate in Python ints
+        return int((values.astype(object) * counts).sum())
+    return int((values * counts).sum())
 
 
 if __name__ == "__main__":
@@ -1,42 +1,102 @@
 """Advent of Code 2024 - Day 02: Red-Nosed Reports."""
+from collections import defaultdict
+from typing import Sequence
 
+import numpy as np
 
-def parse(raw: str) -> list[list[int]]:
-    return [list(map(int, line.split()))
-            for line in raw.splitlines()
-            if line.strip()]
+from aoc.utils.parse import ints_per_line
+from aoc.utils.solver import takes_parsed
 
 
-def solve_part1(raw: str):
-    reports = parse(raw)
-    return sum(is_valid_report(r) for r in reports)
+def parse(raw: str) -> list[Sequence[int]]:
+    return ints_per_line(raw)
 
 
-def solve_part2(raw: str):
-    reports = parse(raw)
-    return sum(is_valid_with_dampener(r) for r in reports)
+@takes_parsed
+def solve_part1(reports: list[Sequence[int]]):
+    return count_valid(reports)
 
 
-def is_valid_report(report: list[int]) -> bool:
+@takes_parsed
+def solve_part2(reports: list[Sequence[int]]):
+    return count_valid(reports, dampener=True)
+
+
+def is_valid_report(report: Sequence[int]) -> bool:
     if len(report) < 2:
         return False
+    return any(_first_violation(report, sign)[0] < 0 for sign in (1, -1))
 
-    diffs = [b - a for a, b in zip(report, report[1:])]
-    increasing = all(1 <= d <= 3 for d in diffs)
-    decreasing = all(-3 <= d <= -1 for d in diffs)
-    return increasing or decreasing
 
+def is_valid_with_dampener(report: Sequence[int]) -> bool:
+    """
+    Linear check: only the two levels of the first bad step can be worth
+    removing, since removing any other level keeps that step in the report.
+    """
+    if len(report) < 2:
+        return False
+    for sign in (1, -1):
+        bad, before = _first_violation(report, sign)
+        if bad < 0:
+            return True
+        if len(report) > 2 and any(_first_violation(report, sign, skip)[0] < 0 for skip in (before, bad)):
+            return True
+    return False
 
-def is_valid_with_dampener(report: list[int]) -> bool:
-    if is_valid_report(report):
-        return True
 
-    for i in range(len(report)):
-        shortened = report[:i] + report[i + 1:]
-        if is_valid_report(shortened):
-            return True
+def _first_violation(report: Sequence[int], sign: int, skip: int = -1) -> tuple[int, int]:
+    """
+    (i, j) where level i is the first one whose step from the previous kept
+    level j is not between 1 and 3 in direction `sign`, ignoring level
+    `skip`; (-1, -1) if every step is safe.
+    """
+    before = -1
+    for i, level in enumerate(report):
+        if i == skip:
+            continue
+        if before >= 0 and not 1 <= sign * (level - report[before]) <= 3:
+            return i, before
+        before = i
+    return -1, -1
+
+
+def count_valid(reports: list[Sequence[int]], dampener: bool = False) -> int:
+    """Count the safe reports, checking reports of the same length as one matrix."""
+    by_length = defaultdict(list)
+    for report in reports:
+        by_length[len(report)].append(report)
+    return sum(
+        int(batch_valid(np.array(group, dtype=np.int64).reshape(len(group), length), dampener).sum())
+        for length, group in by_length.items()
+    )
+
+
+def batch_valid(levels: np.ndarray, dampener: bool = False) -> np.ndarray:
+    """
+    Safety of every row of a (reports, levels) matrix, with vectorised
+    differences. With the dampener, removing level k joins the steps before
+    and after it into one: the report is safe if every step left of k and
+    right of k is, and so is the joined step (prefix/suffix ANDs over the
+    step checks, so O(reports × levels) in total).
+    """
+    rows, n = levels.shape
+    safe = np.zeros(rows, dtype=bool)
+    if n < 2:
+        return safe
+    steps = np.diff(levels, axis=1)
+    for sign in (1, -1):
+        good = (sign * steps >= 1) & (sign * steps <= 3)
+        safe |= good.all(axis=1)
+        if not dampener or n < 3:
+            continue
+        ones = np.ones((rows, 1), dtype=bool)
+        prefix = np.logical_and.accumulate(np.hstack([ones, good]), axis=1)  # prefix[:, j]: steps < j are good
+        suffix = np.logical_and.accumulate(np.hstack([good, ones])[:, ::-1], axis=1)[:, ::-1]  # steps >= j
+        joined = sign * (levels[:, 2:] - levels[:, :-2])
+        inner = prefix[:, :-2] & suffix[:, 2:] & (joined >= 1) & (joined <= 3)
+        safe |= suffix[:, 1] | prefix[:, n - 2] | inner.any(axis=1)
+    return safe
 
-    return False
 
 if __name__ == "__main__":
     from aoc.runner import run_day_from_file
@@ -1,8 +1,17 @@
 """Advent of Code 2024 - Day 03: Mull It Over."""
 import re
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+
+MUL_PATTERN = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)")
+CONTROLLED_PATTERN = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
+CONTROL_PATTERN = re.compile(rb"do\(\)|don't\(\)")
+
+# Longest token: mul(999,999). A match starting at least this far from the
+# end of the buffer cannot depend on data that has not been read yet.
+MAX_TOKEN = len("mul(999,999)")
+CHUNK_SIZE = 1 << 20
 
-MUL_PATTERN = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)")
-CONTROLLED_PATTERN = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
 
 def parse(raw: str) -> str:
     """Return the input with all line breaks removed."""
@@ -11,31 +20,81 @@ def parse(raw: str) -> str:
 
 def extract_and_compute_mul(line: str) -> int:
     """Sum the products of each mul(a,b) found in the line."""
-    return sum(int(a) * int(b) for a, b in MUL_PATTERN.findall(line))
+    return scan([line])
 
 
 def solve_part1(raw: str) -> int:
-    return extract_and_compute_mul(parse(raw))
+    return scan(_slices(raw))
 
 
 def solve_part2(raw: str) -> int:
+    return scan(_slices(raw), controlled=True)
+
+
+def solve_file(path: Union[str, Path], controlled: bool = False, chunk_size: int = CHUNK_SIZE) -> int:
+    """Scan a memory dump straight from disk, in constant memory."""
+    return scan(read_chunks(path, chunk_size), controlled)
+
+
+def read_chunks(path: Union[str, Path], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def _slices(raw: str, size: int = CHUNK_SIZE) -> Iterator[str]:
+    return (raw[i:i + size] for i in range(0, len(raw), size))
+
+
+def scan(chunks: Iterable[Union[str, bytes]], controlled: bool = False) -> int:
+    """
+    Sum the enabled mul(a,b) products over a stream of chunks.
+
+    Line breaks are dropped (a token may span lines, as with `parse`). Only
+    the end of a buffer where a token may still be incomplete (fewer than
+    MAX_TOKEN bytes) and the do()/don't() state are carried over to the next
+    chunk.
+    """
     enabled = True
     total = 0
-    memory = parse(raw)
-
-    for match in CONTROLLED_PATTERN.finditer(memory):
-        token = match.group(0)
-        if token == "do()":
-            enabled = True
-        elif token == "don't()":
-            enabled = False
-        else:
-            a, b = match.groups()
+    tail = b""
+
+    def consume(text: bytes) -> None:
+        nonlocal enabled, total
+        if not controlled:
+            total += _mul_sum(text)
+            return
+        # tokens never overlap, so the text can be cut at each do()/don't()
+        pos = 0
+        for control in CONTROL_PATTERN.finditer(text):
             if enabled:
-                total += int(a) * int(b)
+                total += _mul_sum(text[pos:control.start()])
+            enabled = control.group(0) == b"do()"
+            pos = control.end()
+        if enabled:
+            total += _mul_sum(text[pos:])
 
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        buf = tail + chunk.replace(b"\n", b"").replace(b"\r", b"")
+        # every token starting before `boundary` is complete in buf; cut after
+        # the last of them that runs past it
+        boundary = cut = max(0, len(buf) - (MAX_TOKEN - 1))
+        for match in CONTROLLED_PATTERN.finditer(buf, max(0, boundary - MAX_TOKEN + 1)):
+            if match.start() >= boundary:
+                break
+            cut = max(cut, match.end())
+        consume(buf[:cut])
+        tail = buf[cut:]
+    consume(tail)
     return total
 
+
+def _mul_sum(text: bytes) -> int:
+    return sum(int(a) * int(b) for a, b in MUL_PATTERN.findall(text))
+
+
 if __name__ == "__main__":
     from aoc.runner import run_day_from_file
 
@@ -1,61 +1,74 @@
 """Advent of Code 2024 - Day 04: Ceres Search."""
 
-from aoc.utils.grid import DIRECTIONS_8, parse_grid, in_bounds, step
+from aoc.utils.bitboard import BitBoard, popcount
+from aoc.utils.grid import DIRECTIONS_8, parse_grid
+
+# Part 2 pattern, '.' matches anything; every rotation of it is an X-MAS
+X_MAS = (
+    "M.S",
+    ".A.",
+    "M.S",
+)
+
 
 def parse(raw: str):
     return parse_grid(raw)
 
 
 def solve_part1(raw: str):
-    grid = parse(raw)
-    h, w = len(grid), len(grid[0])
-
-    return sum(
-        1
-        for y in range(h)
-        for x in range(w)
-        for dy, dx in DIRECTIONS_8
-        if matches_xmas(grid, y, x, dy, dx)
-    )
+    return count_word(parse(raw), "XMAS")
 
 
 def solve_part2(raw: str):
-    grid = parse(raw)
-    h, w = len(grid), len(grid[0])
-
+    return count_pattern(parse(raw), X_MAS)
+
+
+def count_word(grid, word: str) -> int:
+    """
+    Occurrences of `word` read in any of the 8 directions. A one-letter word
+    reads the same in every direction, so each of its cells counts once.
+    """
+    if not word:
+        raise ValueError("Cannot count an empty word.")
+    board = BitBoard(len(grid), len(grid[0]), guard=max(1, len(word) - 1))
+    if len(word) == 1:
+        return popcount(board.from_lines(grid, word))
+    masks = {ch: board.from_lines(grid, ch) for ch in set(word)}
     return sum(
-        1
-        for y in range(1, h - 1)
-        for x in range(1, w - 1)
-        if matches_x_mas(grid, y, x)
+        popcount(board.match(masks, [(k * dy, k * dx, ch) for k, ch in enumerate(word)]))
+        for dy, dx in DIRECTIONS_8
     )
 
 
-def matches_xmas(grid, y, x, dy, dx):
-    if not grid[y][x] == 'X':
-        return False
-
-    h, w = len(grid), len(grid[0])
-    end_y, end_x = step(y, x, dy, dx, 3)
-
-    if not in_bounds(end_y, end_x, h, w):
-        return False
-
-    for k, ch in enumerate("XMAS"):
-        yy, xx = step(y, x, dy, dx, k)
-        if grid[yy][xx] != ch:
-            return False
-    return True
-
-
-def matches_x_mas(grid, y, x):
-    if not grid[y][x] == 'A':
-        return False
-
-    d1 = grid[y - 1][x - 1] + grid[y + 1][x + 1]
-    d2 = grid[y - 1][x + 1] + grid[y + 1][x - 1]
-
-    return d1 in ("MS", "SM") and d2 in ("MS", "SM")
+def count_pattern(grid, pattern, rotations: bool = True) -> int:
+    """
+    Positions where `pattern` (lines, '.' matching anything) appears, in any of
+    its four rotations unless `rotations` is False. A match is positioned on
+    the pattern's first non-'.' cell in reading order, so a position matching
+    several rotations counts once, whatever the pattern's shape.
+    """
+    variants = [tuple(pattern)]
+    if rotations:
+        for _ in range(3):
+            variants.append(tuple("".join(col) for col in zip(*variants[-1][::-1])))
+
+    anchored = set()
+    for variant in variants:
+        cells = [(dy, dx, ch) for dy, row in enumerate(variant) for dx, ch in enumerate(row) if ch != '.']
+        if cells:
+            ay, ax, _ = cells[0]
+            anchored.add(tuple((dy - ay, dx - ax, ch) for dy, dx, ch in cells))
+    if not anchored:
+        return 0
+
+    size = max(abs(dx) for cells in anchored for _, dx, _ in cells)
+    board = BitBoard(len(grid), len(grid[0]), guard=max(1, size))
+    chars = {ch for cells in anchored for _, _, ch in cells}
+    masks = {ch: board.from_lines(grid, ch) for ch in chars}
+    found = 0
+    for cells in anchored:
+        found |= board.match(masks, cells)
+    return popcount(found)
 
 
 if __name__ == "__main__":
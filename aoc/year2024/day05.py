@@ -1,4 +1,9 @@
 """Advent of Code 2024 - Day 05: Print Queue."""
+import heapq
+from collections import defaultdict
+from collections.abc import Mapping
+
+from aoc.utils.solver import takes_parsed
 
 
 def parse(raw: str) -> tuple[list[tuple[int, int]], list[list[int]]]:
@@ -13,11 +18,13 @@ def parse(raw: str) -> tuple[list[tuple[int, int]], list[list[int]]]:
     return rules, updates
 
 
-def solve_part1(raw: str):
-    rules, updates = parse(raw)
+@takes_parsed
+def solve_part1(data: tuple[list[tuple[int, int]], list[list[int]]]):
+    rules, updates = data
+    index = build_rule_index(rules)
     total = 0
     for update in updates:
-        if is_valid_update(update, rules):
+        if is_valid_update(update, index):
             total += score(update)
     return total
 
@@ -26,41 +33,81 @@ def score(update: list[int]) -> int:
     return update[len(update) // 2]
 
 
-def solve_part2(raw: str):
-    rules, updates = parse(raw)
+@takes_parsed
+def solve_part2(data: tuple[list[tuple[int, int]], list[list[int]]]):
+    rules, updates = data
+    index = build_rule_index(rules)
     total = 0
     for update in updates:
-        if not is_valid_update(update, rules):
-            fixed = fix_update(update, rules)
+        if not is_valid_update(update, index):
+            fixed = fix_update(update, index)
             if fixed is not None:
                 total += score(fixed)
     return total
 
 
-def is_valid_update(update: list[int], rules: list[tuple[int, ...]]) -> bool:
-    pos = {value: idx for idx, value in enumerate(update)}
+def build_rule_index(rules: list[tuple[int, int]]) -> dict[int, set[int]]:
+    """Map each page to the set of pages that must come after it."""
+    index: dict[int, set[int]] = defaultdict(set)
     for before, after in rules:
-        if before in pos and after in pos:
-            # Rule applies: before must come before after
-            if pos[before] > pos[after]:
-                return False
+        index[before].add(after)
+    return index
 
-    return True
 
+Rules = dict[int, set[int]] | list[tuple[int, int]]
 
-def fix_update(update, rules):
-    pos = {value: idx for idx, value in enumerate(update)}
 
-    for before, after in rules:
-        if before in pos and after in pos and pos[before] > pos[after]:
-            # Rule is violated → swap the two pages and recurse
-            i, j = pos[before], pos[after]
-            new_update = update.copy()
-            new_update[i], new_update[j] = new_update[j], new_update[i]
-            return fix_update(new_update, rules)
-
-    # If we get here, no rule is violated anymore → the update is fixed
-    return update
+def _as_index(rules: Rules) -> dict[int, set[int]]:
+    """An index from build_rule_index, built on the fly if given the rules list."""
+    return rules if isinstance(rules, Mapping) else build_rule_index(rules)
+
+
+def is_valid_update(update: list[int], rules: Rules) -> bool:
+    """
+    No page may come after one it must precede. Each page is checked against
+    the pages seen so far (set.isdisjoint walks the smaller set), so only the
+    rules between pages of the update are looked at.
+
+    `rules` is an index from build_rule_index or a list of (before, after)
+    rules, indexed on each call.
+    """
+    index = _as_index(rules)
+    seen: set[int] = set()
+    empty: set[int] = set()
+    for page in update:
+        if not seen.isdisjoint(index.get(page, empty)):
+            return False
+        seen.add(page)
+    return True
+
+
+def fix_update(update: list[int], rules: Rules) -> list[int] | None:
+    """
+    Reorder the update with Kahn's algorithm over the rules between its
+    pages, keeping pages in their original order when the rules allow it.
+    Return None if those rules contain a cycle. `rules` is taken as in
+    is_valid_update.
+    """
+    index = _as_index(rules)
+    position = {page: i for i, page in enumerate(update)}
+    empty: set[int] = set()
+    successors = {page: [p for p in index.get(page, empty) if p in position] for page in update}
+    pending = dict.fromkeys(update, 0)
+    for targets in successors.values():
+        for page in targets:
+            pending[page] += 1
+
+    ready = [position[page] for page in update if not pending[page]]
+    heapq.heapify(ready)
+    ordered = []
+    while ready:
+        page = update[heapq.heappop(ready)]
+        ordered.append(page)
+        for nxt in successors[page]:
+            pending[nxt] -= 1
+            if not pending[nxt]:
+                heapq.heappush(ready, position[nxt])
+    return ordered if len(ordered) == len(update) else None
 
 
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
 """Advent of Code 2024 - Day 06: Guard Gallivant."""
 
+from array import array
 from collections import defaultdict
-from bisect import bisect, insort
-from typing import Dict, List, Tuple
+from bisect import bisect
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from aoc.utils.grid import parse_grid, in_bounds, step, DIRECTIONS_4
+from aoc.utils.grid import parse_grid
 
 DIR_UP, DIR_RIGHT, DIR_DOWN, DIR_LEFT = range(4)
 
@@ -19,27 +20,91 @@ def parse(raw: str) -> Tuple[List[str], Tuple[int, int]]:
 
 def solve_part1(raw: str) -> int:
     grid, (y, x) = parse(raw)
-    return len(get_path(grid, y, x))
+    return visited_bitmap(grid, y, x).count(1)
 
 
-def get_path(grid: List[str], start_y: int, start_x: int) -> set[Tuple[int, int]]:
+def walk_runs(
+    grid: List[str],
+    start_y: int,
+    start_x: int,
+    rows: Optional[Dict[int, List[int]]] = None,
+    cols: Optional[Dict[int, List[int]]] = None,
+) -> Iterator[Tuple[int, int, int, int, int]]:
+    """
+    Yield the guard's straight runs as (y, x, d, end_y, end_x), jumping from
+    obstacle to obstacle with the obstacle index; the last run ends on the
+    map edge.
+    """
     h, w = len(grid), len(grid[0])
-    y, x = start_y, start_x
-    visited = {(y, x)}
-    d = DIR_UP
-
+    if rows is None or cols is None:
+        rows, cols = build_obstacle_index(grid)
+    y, x, d = start_y, start_x, DIR_UP
     while True:
-        dy, dx = DIRECTIONS_4[d]
-        next_y, next_x = step(y, x, dy, dx)
+        new_y, new_x, new_d = move_with_index(y, x, d, rows, cols, h, w)
+        if not (0 <= new_y < h and 0 <= new_x < w):
+            yield y, x, d, min(max(new_y, 0), h - 1), min(max(new_x, 0), w - 1)
+            return
+        yield y, x, d, new_y, new_x
+        y, x, d = new_y, new_x, new_d
 
-        if not in_bounds(next_y, next_x, h, w):
-            return visited
 
-        if grid[next_y][next_x] != "#":
-            y, x = next_y, next_x
-            visited.add((y, x))
-        else:
-            d = (d + 1) % 4
+def _run_span(y: int, x: int, end_y: int, end_x: int, w: int) -> Tuple[slice, int, int]:
+    """(slice of the run's cells in a row-major buffer, first cell along the axis, number of cells)."""
+    if y == end_y:
+        lo, hi = min(x, end_x), max(x, end_x)
+        return slice(y * w + lo, y * w + hi + 1), lo, hi - lo + 1
+    lo, hi = min(y, end_y), max(y, end_y)
+    return slice(lo * w + x, hi * w + x + 1, w), lo, hi - lo + 1
+
+
+def get_path(grid: List[str], start_y: int, start_x: int) -> set[Tuple[int, int]]:
+    w = len(grid[0])
+    visited = visited_bitmap(grid, start_y, start_x)
+    return {divmod(i, w) for i, v in enumerate(visited) if v}
+
+
+def visited_bitmap(grid: List[str], start_y: int, start_x: int) -> bytearray:
+    """Bitmap of the visited cells: visited[y * w + x] is 1 if the guard walks on (y, x)."""
+    w = len(grid[0])
+    visited = bytearray(len(grid) * w)
+    for y, x, _, end_y, end_x in walk_runs(grid, start_y, start_x):
+        span, _, n = _run_span(y, x, end_y, end_x, w)
+        visited[span] = b"\x01" * n
+    return visited
+
+
+def first_visits(
+    grid: List[str],
+    start_y: int,
+    start_x: int,
+    rows: Optional[Dict[int, List[int]]] = None,
+    cols: Optional[Dict[int, List[int]]] = None,
+) -> Iterator[Tuple[int, int, Tuple[int, int, int]]]:
+    """
+    Lazily yield (y, x, run) for every cell after the start, in the order
+    the guard first reaches it, where run = (y0, x0, d) is the state at the
+    beginning of that run: everything the guard did up to it is unaffected
+    by an obstacle placed on (y, x). Only the cells a run adds to the
+    visited bitmap are looked at one by one.
+    """
+    w = len(grid[0])
+    visited = bytearray(len(grid) * w)
+    visited[start_y * w + start_x] = 1
+    for y, x, d, end_y, end_x in walk_runs(grid, start_y, start_x, rows, cols):
+        span, lo, n = _run_span(y, x, end_y, end_x, w)
+        seen = visited[span]
+        if 0 not in seen:
+            continue
+        visited[span] = b"\x01" * n
+        new = []
+        k = seen.find(0)
+        while k >= 0:
+            new.append(k)
+            k = seen.find(0, k + 1)
+        if d in (DIR_UP, DIR_LEFT):
+            new.reverse()
+        for k in new:
+            yield (y, lo + k, (y, x, d)) if y == end_y else (lo + k, x, (y, x, d))
 
 
 def build_obstacle_index(grid: List[str]) -> Tuple[Dict[int, List[int]], Dict[int, List[int]]]:
@@ -51,16 +116,13 @@ def build_obstacle_index(grid: List[str]) -> Tuple[Dict[int, List[int]], Dict[in
     rows: Dict[int, List[int]] = defaultdict(list)
     cols: Dict[int, List[int]] = defaultdict(list)
 
+    # scanning rows top to bottom and left to right keeps both lists sorted
     for y, row in enumerate(grid):
-        for x, ch in enumerate(row):
-            if ch == "#":
-                rows[y].append(x)
-                cols[x].append(y)
-
-    for lst in rows.values():
-        lst.sort()
-    for lst in cols.values():
-        lst.sort()
+        x = row.find("#")
+        while x >= 0:
+            rows[y].append(x)
+            cols[x].append(y)
+            x = row.find("#", x + 1)
 
     return rows, cols
 
@@ -111,68 +173,174 @@ def move_with_index(
     return y, new_x, DIR_UP
 
 
-def is_looping(
-    start_y: int,
-    start_x: int,
-    rows: Dict[int, List[int]],
-    cols: Dict[int, List[int]],
-    h: int,
-    w: int,
-) -> bool:
-    y, x, d = start_y, start_x, DIR_UP
-    seen = {(y, x, d)}
-    while 0 <= y < h and 0 <= x < w:
-        y, x, d = move_with_index(y, x, d, rows, cols, h, w)
-        state = (y, x, d)
-        if state in seen:
-            return True
-        seen.add(state)
-    return False
+EXIT = -1  # jump target of a state whose run leaves the map
 
 
-def solve_part2(raw: str) -> int:
+class JumpTable:
+    """
+    Guard moves precomputed for every state.
+
+    A state is (y, x, d) packed as ((y * w + x) << 2) | d. jump[state] is the
+    state reached at the end of the run from it: the cell just before the
+    next obstacle, turned right, or EXIT. Both the table and the seen-state
+    stamps are flat integer arrays, so a loop check is a tight
+    `s = jump[s]` loop.
+
+    A virtual obstacle only changes the runs that cross it, which lie on its
+    row and column: `place(y, x)` patches those slices of the table in place
+    and returns what `remove` needs to restore them.
+    """
+
+    __slots__ = ("h", "w", "rows", "cols", "jump", "seen", "stamp")
+
+    def __init__(self, grid: List[str]):
+        self.h, self.w = h, w = len(grid), len(grid[0])
+        self.rows, self.cols = build_obstacle_index(grid)
+        self.jump = jump = array("l", [EXIT]) * (h * w * 4)
+        self.seen = array("l", [0]) * (h * w * 4)
+        self.stamp = 0
+
+        # every run between two obstacles (or the edge) shares its target
+        for y in range(h):
+            bounds = [-1] + self.rows.get(y, []) + [w]
+            for a, b in zip(bounds, bounds[1:]):
+                n = b - a - 1
+                if n:
+                    left = self.state(y, a + 1, DIR_UP) if a >= 0 else EXIT
+                    right = self.state(y, b - 1, DIR_DOWN) if b < w else EXIT
+                    jump[self._span(y, a + 1, b, DIR_LEFT, False)] = self._fill(left, n)
+                    jump[self._span(y, a + 1, b, DIR_RIGHT, False)] = self._fill(right, n)
+        for x in range(w):
+            bounds = [-1] + self.cols.get(x, []) + [h]
+            for a, b in zip(bounds, bounds[1:]):
+                n = b - a - 1
+                if n:
+                    up = self.state(a + 1, x, DIR_RIGHT) if a >= 0 else EXIT
+                    down = self.state(b - 1, x, DIR_LEFT) if b < h else EXIT
+                    jump[self._span(x, a + 1, b, DIR_UP, True)] = self._fill(up, n)
+                    jump[self._span(x, a + 1, b, DIR_DOWN, True)] = self._fill(down, n)
+
+    def state(self, y: int, x: int, d: int) -> int:
+        return ((y * self.w + x) << 2) | d
+
+    def _span(self, fixed: int, lo: int, hi: int, d: int, vertical: bool) -> slice:
+        """States in direction d of cells lo..hi-1 of column `fixed` (vertical) or row `fixed`."""
+        if vertical:
+            first, stride = self.state(lo, fixed, d), self.w * 4
+        else:
+            first, stride = self.state(fixed, lo, d), 4
+        return slice(first, first + (hi - lo) * stride, stride)
+
+    @staticmethod
+    def _fill(target: int, n: int) -> array:
+        return array("l", [target]) * n
+
+    def place(self, oy: int, ox: int) -> List[Tuple[slice, array]]:
+        """Patch the runs crossing a virtual obstacle at (oy, ox); return the saved slices."""
+        h, w, jump = self.h, self.w, self.jump
+        column, row = self.cols.get(ox, []), self.rows.get(oy, [])
+        i, j = bisect(column, oy), bisect(row, ox)
+        above, below = column[i - 1] if i else -1, column[i] if i < len(column) else h
+        left, right = row[j - 1] if j else -1, row[j] if j < len(row) else w
+
+        cell, down, side = oy * w + ox, w << 2, 4
+        patches = (
+            # (first state, stride, count, new target) for the runs moving up from
+            # below the obstacle, down from above it, left from its right and
+            # right from its left
+            (((cell + w) << 2) | DIR_UP, down, below - oy - 1, ((cell + w) << 2) | DIR_RIGHT),
+            (((cell - (oy - above - 1) * w) << 2) | DIR_DOWN, down, oy - above - 1, ((cell - w) << 2) | DIR_LEFT),
+            (((cell + 1) << 2) | DIR_LEFT, side, right - ox - 1, ((cell + 1) << 2) | DIR_UP),
+            (((cell - (ox - left - 1)) << 2) | DIR_RIGHT, side, ox - left - 1, ((cell - 1) << 2) | DIR_DOWN),
+        )
+        saved = []
+        for first, stride, n, target in patches:
+            if n:
+                span = slice(first, first + n * stride, stride)
+                saved.append((span, jump[span]))
+                jump[span] = array("l", [target]) * n
+        return saved
+
+    def remove(self, saved: List[Tuple[slice, array]]) -> None:
+        for span, values in reversed(saved):
+            self.jump[span] = values
+
+    def loops_from(self, s: int) -> bool:
+        """True if the guard never leaves the map from state s (a state repeats)."""
+        self.stamp += 1
+        stamp, jump, seen = self.stamp, self.jump, self.seen
+        while s != EXIT:
+            if seen[s] == stamp:
+                return True
+            seen[s] = stamp
+            s = jump[s]
+        return False
+
+    def loops_with(self, oy: int, ox: int, resume: int) -> bool:
+        saved = self.place(oy, ox)
+        try:
+            return self.loops_from(resume)
+        finally:
+            self.remove(saved)
+
+
+def solve_part2(raw: str, workers: int = 1) -> int:
     grid, (start_y, start_x) = parse(raw)
-    h, w = len(grid), len(grid[0])
-    rows, cols = build_obstacle_index(grid)
+    table = JumpTable(grid)
+    candidates = [
+        (y, x, table.state(*run))
+        for y, x, run in first_visits(grid, start_y, start_x, table.rows, table.cols)
+    ]
+    return count_loops(table, candidates, workers)
 
-    candidates: set[Tuple[int, int]] = set()
-    y, x, d = start_y, start_x, DIR_UP
 
-    while 0 <= y < h and 0 <= x < w:
-        new_y, new_x, new_d = move_with_index(y, x, d, rows, cols, h, w)
+def count_loops(table: JumpTable, candidates: List[Tuple[int, int, int]], workers: int = 1) -> int:
+    """
+    Count the candidate obstacles (y, x, resume state) that trap the guard in
+    a loop.
 
-        if d == DIR_UP:
-            for yy in range(new_y + 1, y + 1):
-                candidates.add((yy, x))
-        elif d == DIR_RIGHT:
-            for xx in range(x, new_x + 1):
-                candidates.add((y, xx))
-        elif d == DIR_DOWN:
-            for yy in range(y, new_y + 1):
-                candidates.add((yy, x))
-        else:  # DIR_LEFT
-            for xx in range(new_x + 1, x + 1):
-                candidates.add((y, xx))
+    With workers > 1 the candidates are dealt round-robin to a process pool.
+    Each worker receives its own copy of the table once and patches it for
+    one candidate at a time, and the partial counts are added in partition
+    order, so the result does not depend on scheduling.
+    """
+    if workers <= 1 or len(candidates) < 2:
+        return _count_loops_in(table, candidates)
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # fork where available: workers start without re-importing the solver
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    partitions = [candidates[i::workers] for i in range(workers)]
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(table,),
+    ) as pool:
+        return sum(pool.map(_count_partition, partitions))
+
+
+def _count_loops_in(table: JumpTable, candidates: List[Tuple[int, int, int]]) -> int:
+    return sum(table.loops_with(oy, ox, resume) for oy, ox, resume in candidates)
 
-        y, x, d = new_y, new_x, new_d
 
-    candidates.discard((start_y, start_x))
+# Jump table of a worker process, set once by _init_worker
+_shared: Optional[JumpTable] = None
 
-    loop_count = 0
-    for oy, ox in list(candidates):
-        insort(rows[oy], ox)
-        insort(cols[ox], oy)
 
-        if is_looping(start_y, start_x, rows, cols, h, w):
-            loop_count += 1
+def _init_worker(table: JumpTable) -> None:
+    global _shared
+    _shared = table
 
-        rows[oy].remove(ox)
-        cols[ox].remove(oy)
 
-    return loop_count
+def _count_partition(candidates: List[Tuple[int, int, int]]) -> int:
+    return _count_loops_in(_shared, candidates)
 
 
 if __name__ == "__main__":
     from aoc.runner import run_day_from_file
 
-    run_day_from_file(__file__, globals())
\ No newline at end of file
+    run_day_from_file(__file__, globals())
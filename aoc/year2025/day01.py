@@ -1,41 +1,32 @@
 """Advent of Code 2025 - Day 01: Secret Entrance."""
+import numpy as np
 
+from aoc.utils.parse import ints
+from aoc.utils.solver import takes_parsed
 
-def parse(raw: str):
-    return raw.splitlines()
 
+def parse(raw: str) -> np.ndarray:
+    """Rotations as signed clicks: L is negative, R positive."""
+    return ints(raw.translate({ord("L"): "-", ord("R"): None}), numpy=True)
 
-def solve_part1(raw: str):
-    moves = parse(raw)
-    pos = 50
-    hits = 0
-    for m in moves:
-        sign = -1 if m[0] == "L" else 1
-        step = int(m[1:]) % 100
-        pos = (pos + sign * step) % 100
-        if pos == 0:
-            hits += 1
-    return hits
 
+@takes_parsed
+def solve_part1(moves: np.ndarray, size: int = 100, start: int = 50):
+    # where the dial rests after each rotation
+    positions = (start + np.cumsum(moves)) % size
+    return int(np.count_nonzero(positions == 0))
 
-def solve_part2(raw: str):
-    moves = parse(raw)
-    pos = 50
-    hits = 0
-    for m in moves:
-        sign = -1 if m[0] == "L" else 1
-        steps = int(m[1:])
 
-        # smallest t in 1..100 with (pos + sign*t) % 100 == 0
-        t0 = (-sign * pos) % 100
-        if t0 == 0:
-            t0 = 100
-
-        if steps >= t0:
-            hits += 1 + (steps - t0) // 100
-
-        pos = (pos + sign * steps) % 100
-    return hits
+@takes_parsed
+def solve_part2(moves: np.ndarray, size: int = 100, start: int = 50):
+    # Unwrapped dial positions before (a) and after (b) each rotation. The dial
+    # points at 0 on every multiple of `size` it clicks past: those in (a, b]
+    # turning right, those in [b, a) turning left.
+    ends = start + np.cumsum(moves)
+    begins = np.concatenate(([start], ends[:-1]))
+    right = ends // size - begins // size
+    left = (begins - 1) // size - (ends - 1) // size
+    return int(np.where(moves > 0, right, left).sum())
 
 
 if __name__ == "__main__":
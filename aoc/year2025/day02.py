@@ -1,11 +1,11 @@
 """Advent of Code 2025 - Day 02: Gift Shop."""
 
+from aoc.utils.parse import ints
+
 
 def parse(raw: str):
-    ranges = []
-    for part in raw.split(','):
-        ranges.append(map(int, part.split('-')))
-    return ranges
+    bounds = ints(raw, signed=False)
+    return list(zip(bounds[::2], bounds[1::2]))
 
 
 def solve_part1(raw: str):
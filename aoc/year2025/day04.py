@@ -1,5 +1,17 @@
 """Advent of Code 2025 - Day 04: Printing Department."""
-from aoc.utils.grid import neighbors8, parse_grid, in_bounds, get
+from typing import Iterator
+
+import numpy as np
+
+from aoc.utils.bitboard import BitBoard, popcount, run_until_fixpoint
+from aoc.utils.grid import FlatGrid, parse_grid
+from aoc.utils.solver import takes_parsed
+
+# Bitboard generations tried before handing over to removal_waves: a bitboard
+# step is a handful of whole-grid operations, cheaper than the worklist while
+# each wave removes many rolls, but inputs that peel over thousands of waves
+# would pay one full-grid step per wave.
+BITBOARD_GENERATIONS = 32
 
 def parse(raw: str) -> tuple[list[list[str]], tuple[int, int]]:
     rolls = [list(row) for row in parse_grid(raw) if row]
@@ -7,41 +19,80 @@ def parse(raw: str) -> tuple[list[list[str]], tuple[int, int]]:
     return rolls, (w, h)
 
 
-def solve_part1(raw: str):
-    rolls, (w, h) = parse(raw)
-    return sum(
-        1
-        for r in range(h)
-        for c in range(w)
-        if rolls[r][c] == '@' and _is_free_to_remove(rolls, r, c, w, h)
-    )
-
-
-def solve_part2(raw: str):
-    rolls, (w, h) = parse(raw)
-    total = 0
-    removed = True
-    while removed:
-        removed = False
-        for r in range(h) :
-            for c in range(w):
-                if rolls[r][c] == '@' and _is_free_to_remove(rolls, r, c, w, h):
-                    rolls[r][c] = '.'
-                    total += 1
-                    removed = True
-    return total
-
-
-def _is_free_to_remove(rolls, row, col, w, h) -> bool:
-    count = 0
-    for y, x in neighbors8(row, col):
-        if not in_bounds(y, x, h, w):
-            continue
-        if get(rolls, y, x) == '@':
-            count += 1
-            if count >= 4:
-                return False
-    return True
+@takes_parsed
+def solve_part1(data: tuple[list[list[str]], tuple[int, int]]):
+    rolls, (w, h) = data
+    board = BitBoard(h, w)
+    bits = board.from_lines(rolls, '@')
+    return popcount(bits & ~_crowded(board, bits))
+
+
+@takes_parsed
+def solve_part2(data: tuple[list[list[str]], tuple[int, int]]):
+    # the set of rolls left once nothing is free does not depend on the
+    # removal order, so both engines only need counting
+    rolls, (w, h) = data
+    board = BitBoard(h, w)
+    bits = board.from_lines(rolls, '@')
+
+    def step(b: int) -> int:
+        return b & _crowded(board, b)
+
+    left, generations = run_until_fixpoint(bits, step, max_generations=BITBOARD_GENERATIONS)
+    removed = popcount(bits) - popcount(left)
+    if generations == BITBOARD_GENERATIONS:
+        # still peeling: finish with the worklist, O(h·w) whatever the waves
+        removed += sum(len(wave) for wave in removal_waves((board.to_lines(left, '@'), (w, h))))
+    return removed
+
+
+def removal_waves(data: tuple[list[list[str]], tuple[int, int]], threshold: int = 4) -> Iterator[list[tuple[int, int]]]:
+    """
+    Yield the rolls removed by each wave, as (y, x) in removal order.
+
+    Incremental peeling: neighbour counts are computed once, and removing a
+    roll only decrements the counts of its neighbours, queueing those that
+    drop below `threshold` for the next wave. Every cell is removed at most
+    once, so the total work is O(h·w) however many waves there are (a
+    bitboard fixpoint pays a full-grid step per wave). Wave k is exactly the
+    set of rolls a generation-by-generation sweep removes at step k.
+    """
+    rolls, _ = data
+    grid = FlatGrid(["".join(row) for row in rolls])
+    cells, offsets = grid.cells, grid.offsets8
+    roll, empty = ord('@'), ord('.')
+
+    # initial counts in bulk: the 8 shifted views of the padded grid, summed
+    is_roll = np.frombuffer(bytes(cells), dtype=np.uint8).reshape(-1, grid.stride) == roll
+    h, w = is_roll.shape
+    around = np.zeros((h, w), dtype=np.uint8)
+    inner = around[1:-1, 1:-1]
+    for dy in (-1, 0, 1):
+        for dx in (-1, 0, 1):
+            if dy or dx:
+                inner += is_roll[1 + dy:h - 1 + dy, 1 + dx:w - 1 + dx]
+    counts = bytearray(around.tobytes())
+
+    wave = np.flatnonzero(is_roll & (around < threshold)).tolist()
+    for i in wave:
+        cells[i] = empty
+    while wave:
+        yield [grid.coords(i) for i in wave]
+        following = []
+        for i in wave:
+            for o in offsets:
+                j = i + o
+                if cells[j] == roll:
+                    counts[j] -= 1
+                    if counts[j] < threshold:
+                        cells[j] = empty  # taken now, so it is queued only once
+                        following.append(j)
+        wave = following
+
+
+def _crowded(board: BitBoard, bits: int) -> int:
+    """Cells with at least 4 rolls among their 8 neighbours."""
+    return board.at_least(board.neighbor_counts(bits), 4)
 
 
 if __name__ == "__main__":
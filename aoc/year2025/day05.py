@@ -1,13 +1,13 @@
 """Advent of Code 2025 - Day 05: Cafeteria."""
 
+from aoc.utils.parse import ints
+
 
 def parse(raw: str) -> tuple[list[tuple[int, int]], list[int]]:
     parts = raw.strip().split("\n\n")
 
-    rules: list[tuple[int, int]] = [
-        (int(a), int(b))
-        for a, b in (line.split("-") for line in parts[0].splitlines())
-    ]
+    bounds = ints(parts[0], signed=False)
+    rules: list[tuple[int, int]] = list(zip(bounds[::2], bounds[1::2]))
 
     # Merge overlapping/adjacent intervals
     merged: list[list[int]] = []
@@ -19,7 +19,7 @@ def parse(raw: str) -> tuple[list[tuple[int, int]], list[int]]:
 
     merged_rules: list[tuple[int, int]] = [(s, e) for s, e in merged]
 
-    available = list(map(int, parts[1].strip().splitlines()))
+    available = list(ints(parts[1]))
 
     return merged_rules, available
 
@@ -5,9 +5,13 @@ from typing import List, Tuple
 from collections import Counter
 from itertools import combinations
 
+from aoc.utils.parse import ints
+from aoc.utils.solver import takes_parsed
+
 
 def parse(raw: str) -> List[Tuple[int, ...]]:
-    return [tuple(map(int, line.split(','))) for line in raw.splitlines()]
+    values = ints(raw)
+    return list(zip(values[::3], values[1::3], values[2::3]))
 
 
 class DSU:
@@ -42,8 +46,8 @@ def dist2(p1: Tuple[int, ...], p2: Tuple[int, ...]) -> int:
     return (p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2 + (p1[2] - p2[2]) ** 2
 
 
-def solve_part1(raw: str, n: int = 1000) -> int:
-    points = parse(raw)
+@takes_parsed
+def solve_part1(points: List[Tuple[int, ...]], n: int = 1000) -> int:
 
     # build all pair distances and pick the k smallest
     edges = ((dist2(p1, p2), i, j) for (i, p1), (j, p2) in combinations(enumerate(points), 2))
@@ -59,8 +63,8 @@ def solve_part1(raw: str, n: int = 1000) -> int:
     return prod(sizes[:3])
 
 
-def solve_part2(raw: str):
-    points = parse(raw)
+@takes_parsed
+def solve_part2(points: List[Tuple[int, ...]]):
     n = len(points)
     INF = 10**30
     key = [INF] * n
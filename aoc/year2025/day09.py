@@ -3,9 +3,13 @@ from itertools import combinations
 from bisect import bisect_left, bisect_right
 from typing import List, Tuple, Dict
 
+from aoc.utils.parse import ints
+from aoc.utils.solver import takes_parsed
+
 
 def parse(raw: str) -> list[tuple[int, ...]]:
-    return [tuple(map(int, line.split(','))) for line in raw.splitlines() if line.strip()]
+    values = ints(raw)
+    return list(zip(values[::2], values[1::2]))
 
 
 def rect(a, b) -> Tuple[int, int, int, int]:
@@ -89,8 +93,8 @@ def any_segment_overlaps_rectangle(rect, v_by_x, v_x_keys, h_by_y, h_y_keys):
     return False
 
 
-def solve_part1(raw: str):
-    reds = parse(raw)
+@takes_parsed
+def solve_part1(reds: List[Tuple[int, ...]]):
     best = 0
     # iterate pairs
     for a, b in combinations(reds, 2):
@@ -100,8 +104,8 @@ def solve_part1(raw: str):
     return best
 
 
-def solve_part2(raw: str):
-    reds = parse(raw)
+@takes_parsed
+def solve_part2(reds: List[Tuple[int, ...]]):
     n = len(reds)
     # prebuild all rectangles as (xmin, xmax, ymin, ymax)
     rects = [rect(reds[i], reds[j]) for i in range(n - 1) for j in range(i + 1, n)]
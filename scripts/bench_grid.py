@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: 8-neighbour counting with the tuple-based grid helpers
+versus FlatGrid (linear indices, sentinel border, precomputed offsets).
+
+Usage: python scripts/bench_grid.py [SIZE] [REPEAT]
+"""
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.utils.grid import FlatGrid, in_bounds, neighbors8  # noqa: E402
+
+
+def make_grid(size: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return ["".join(rng.choice("@.") for _ in range(size)) for _ in range(size)]
+
+
+def count_tuples(lines: list[str]) -> int:
+    h, w = len(lines), len(lines[0])
+    total = 0
+    for y in range(h):
+        for x in range(w):
+            if lines[y][x] != "@":
+                continue
+            for yy, xx in neighbors8(y, x):
+                if in_bounds(yy, xx, h, w) and lines[yy][xx] == "@":
+                    total += 1
+    return total
+
+
+def count_flat(grid: FlatGrid) -> int:
+    cells = grid.cells
+    roll = ord("@")
+    offsets = grid.offsets8
+    total = 0
+    for i in grid.find("@"):
+        for o in offsets:
+            if cells[i + o] == roll:
+                total += 1
+    return total
+
+
+def main(argv=None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    size = int(argv[0]) if argv else 300
+    repeat = int(argv[1]) if len(argv) > 1 else 3
+
+    lines = make_grid(size)
+    grid = FlatGrid(lines)
+    assert count_tuples(lines) == count_flat(grid)
+
+    t_tuple = min(timeit.repeat(lambda: count_tuples(lines), number=1, repeat=repeat))
+    t_flat = min(timeit.repeat(lambda: count_flat(grid), number=1, repeat=repeat))
+    print(f"{size}x{size} grid, 8-neighbour count of '@' cells (best of {repeat})")
+    print(f"  tuple helpers : {t_tuple * 1e3:8.1f} ms")
+    print(f"  FlatGrid      : {t_flat * 1e3:8.1f} ms  ({t_tuple / t_flat:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
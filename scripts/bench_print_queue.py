@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: 2024 day 05 with thousands of rules and long updates, rule scans
+and swap-and-recurse fixing (the original approach) versus the rule index,
+seen-set validity check and Kahn ordering of aoc.year2024.day05.
+
+Usage: python scripts/bench_print_queue.py [PAGES] [UPDATES] [REPEAT]
+"""
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.year2024 import day05  # noqa: E402
+
+
+def make_input(pages: int, updates: int, length: int, seed: int = 0):
+    """Rules totally ordering `pages` pages (pages * (pages - 1) / 2 of them), shuffled updates."""
+    rng = random.Random(seed)
+    order = list(range(10, 10 + pages))
+    rng.shuffle(order)
+    rules = [(order[i], order[j]) for i in range(pages) for j in range(i + 1, pages)]
+    rng.shuffle(rules)
+    return rules, [rng.sample(order, length) for _ in range(updates)]
+
+
+def is_valid_scan(update, rules):
+    pos = {value: idx for idx, value in enumerate(update)}
+    for before, after in rules:
+        if before in pos and after in pos and pos[before] > pos[after]:
+            return False
+    return True
+
+
+def fix_swaps(update, rules):
+    pos = {value: idx for idx, value in enumerate(update)}
+    for before, after in rules:
+        if before in pos and after in pos and pos[before] > pos[after]:
+            i, j = pos[before], pos[after]
+            new_update = update.copy()
+            new_update[i], new_update[j] = new_update[j], new_update[i]
+            return fix_swaps(new_update, rules)
+    return update
+
+
+def part2_scan(rules, updates):
+    return sum(day05.score(fix_swaps(u, rules)) for u in updates if not is_valid_scan(u, rules))
+
+
+def part2_index(rules, updates):
+    index = day05.build_rule_index(rules)
+    return sum(day05.score(day05.fix_update(u, index)) for u in updates if not day05.is_valid_update(u, index))
+
+
+def main(argv=None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    pages = int(argv[0]) if argv else 100
+    updates = int(argv[1]) if len(argv) > 1 else 100
+    repeat = int(argv[2]) if len(argv) > 2 else 3
+
+    print(f"{pages * (pages - 1) // 2} rules, {updates} updates (best of {repeat})")
+    for length in (9, 23, pages - 1):
+        rules, batch = make_input(pages, updates, length)
+        best_index = min(timeit.repeat(lambda: part2_index(rules, batch), number=1, repeat=repeat))
+        try:
+            assert part2_scan(rules, batch) == part2_index(rules, batch)
+            best_scan = min(timeit.repeat(lambda: part2_scan(rules, batch), number=1, repeat=repeat))
+            scan = f"{best_scan * 1e3:10.1f} ms"
+        except RecursionError:
+            scan = "RecursionError"
+        print(f"  updates of {length:3} pages: scan + swaps {scan:>14}, index + Kahn {best_index * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
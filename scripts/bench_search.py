@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: shortest paths on a synthetic grid with the tuple/dict searches
+days usually write versus aoc.utils.search (flat arrays over a FlatGrid).
+
+Usage: python scripts/bench_search.py [SIZE] [REPEAT]
+"""
+import heapq
+import random
+import sys
+import timeit
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.utils.grid import DIRECTIONS_4, FlatGrid, in_bounds  # noqa: E402
+from aoc.utils.search import GridGraph, astar, bfs, dijkstra  # noqa: E402
+
+
+def make_grid(size: int, seed: int = 0, walls: float = 0.25) -> list[str]:
+    rng = random.Random(seed)
+    lines = [
+        "".join("#" if rng.random() < walls else rng.choice("123456789") for _ in range(size))
+        for _ in range(size)
+    ]
+    # keep the corners open
+    for y in (0, 1):
+        lines[y] = "11" + lines[y][2:]
+    for y in (-2, -1):
+        lines[y] = lines[y][:-2] + "11"
+    return lines
+
+
+def bfs_tuples(lines, start, goal):
+    h, w = len(lines), len(lines[0])
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        y, x = queue.popleft()
+        if (y, x) == goal:
+            return dist[goal]
+        for dy, dx in DIRECTIONS_4:
+            nxt = (y + dy, x + dx)
+            if in_bounds(*nxt, h, w) and lines[nxt[0]][nxt[1]] != "#" and nxt not in dist:
+                dist[nxt] = dist[(y, x)] + 1
+                queue.append(nxt)
+    return None
+
+
+def dijkstra_tuples(lines, start, goal):
+    h, w = len(lines), len(lines[0])
+    dist = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        d, (y, x) = heapq.heappop(heap)
+        if (y, x) == goal:
+            return d
+        if d > dist[(y, x)]:
+            continue
+        for dy, dx in DIRECTIONS_4:
+            ny, nx = y + dy, x + dx
+            if in_bounds(ny, nx, h, w) and lines[ny][nx] != "#":
+                nd = d + int(lines[ny][nx])
+                if nd < dist.get((ny, nx), nd + 1):
+                    dist[(ny, nx)] = nd
+                    heapq.heappush(heap, (nd, (ny, nx)))
+    return None
+
+
+def main(argv=None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    size = int(argv[0]) if argv else 1000
+    repeat = int(argv[1]) if len(argv) > 1 else 3
+
+    lines = make_grid(size)
+    start, goal = (0, 0), (size - 1, size - 1)
+    grid = FlatGrid(lines)
+    unweighted = GridGraph(grid)
+    weighted = GridGraph(grid, costs={str(d): d for d in range(1, 10)})
+    heuristic = weighted.manhattan(goal)
+
+    assert bfs_tuples(lines, start, goal) == bfs(unweighted, start, goal).distance(goal) is not None
+    expected = dijkstra_tuples(lines, start, goal)
+    assert expected == dijkstra(weighted, start, goal).distance(goal)
+    assert expected == astar(weighted, start, goal, heuristic).distance(goal)
+
+    cases = [
+        ("BFS, tuples + dict", lambda: bfs_tuples(lines, start, goal)),
+        ("BFS, aoc.utils.search", lambda: bfs(unweighted, start, goal)),
+        ("Dijkstra, tuples + dict", lambda: dijkstra_tuples(lines, start, goal)),
+        ("Dijkstra, aoc.utils.search", lambda: dijkstra(weighted, start, goal)),
+        ("A*, aoc.utils.search", lambda: astar(weighted, start, goal, heuristic)),
+    ]
+    print(f"{size}x{size} grid, corner to corner (best of {repeat})")
+    for name, func in cases:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"  {name:<28}: {best * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
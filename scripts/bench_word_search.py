@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Scaling check: 2024 day 04 word and X-MAS counting on random square grids of
+growing size. The bitboard work is linear in the number of cells, so the
+time per cell should stay roughly flat as the grid grows.
+
+Usage: python scripts/bench_word_search.py [MAX_SIZE] [REPEAT]
+"""
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.year2024 import day04  # noqa: E402
+
+
+def make_grid(size: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return ["".join(rng.choices("XMAS", k=size)) for _ in range(size)]
+
+
+def main(argv=None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    max_size = int(argv[0]) if argv else 4000
+    repeat = int(argv[1]) if len(argv) > 1 else 3
+
+    print(f"best of {repeat}")
+    size = 500
+    while size <= max_size:
+        grid = make_grid(size)
+        word = min(timeit.repeat(lambda: day04.count_word(grid, "XMAS"), number=1, repeat=repeat))
+        pattern = min(timeit.repeat(lambda: day04.count_pattern(grid, day04.X_MAS), number=1, repeat=repeat))
+        cells = size * size
+        print(
+            f"  {size:5}x{size:<5} count_word {word * 1e3:9.1f} ms ({word / cells * 1e9:5.0f} ns/cell), "
+            f"count_pattern {pattern * 1e3:9.1f} ms ({pattern / cells * 1e9:5.0f} ns/cell)"
+        )
+        size *= 2
+
+
+if __name__ == "__main__":
+    main()
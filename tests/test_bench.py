@@ -0,0 +1,20 @@
+from aoc import bench
+
+
+def test_summarize():
+    stats = bench.summarize([1.0, 2.0, 3.0, 4.0, 5.0])
+    assert stats["min"] == 1.0
+    assert stats["median"] == 3.0
+    assert stats["mean"] == 3.0
+    assert stats["p95"] == 4.8
+    assert stats["runs"] == 5
+
+
+def test_compare_flags_regressions_over_threshold():
+    baseline = {"2025/01/part1": {"median": 1.0}, "2025/01/part2": {"median": 1.0}}
+    current = {
+        "2025/01/part1": {"median": 1.05},
+        "2025/01/part2": {"median": 1.5},
+        "2025/02/part1": {"median": 9.0},
+    }
+    assert bench.compare(current, baseline, threshold=0.1) == ["2025/01/part2"]
@@ -0,0 +1,72 @@
+from aoc.utils.bitboard import BitBoard, popcount, run_until_fixpoint
+from aoc.utils.grid import DIRECTIONS_4
+
+
+LINES = [
+    "#..#",
+    ".##.",
+    "#..#",
+]
+
+
+def test_round_trip_and_cells():
+    board = BitBoard(3, 4)
+    bits = board.from_lines(LINES, "#")
+
+    assert board.to_lines(bits) == LINES
+    assert popcount(bits) == 6
+    assert list(board.cells(bits)) == [(0, 0), (0, 3), (1, 1), (1, 2), (2, 0), (2, 3)]
+
+
+def test_shift_does_not_wrap_rows():
+    board = BitBoard(3, 4)
+    bits = board.from_lines(LINES, "#")
+
+    assert board.to_lines(board.shift(bits, 0, 1)) == [".#..", "..##", ".#.."]
+    assert board.to_lines(board.shift(bits, 0, -1)) == ["..#.", "##..", "..#."]
+    assert board.to_lines(board.shift(bits, -1, 0)) == [".##.", "#..#", "...."]
+
+
+def _count(planes, board, y, x):
+    return sum((plane >> (y * board.stride + x) & 1) << k for k, plane in enumerate(planes))
+
+
+def test_neighbor_counts_match_brute_force():
+    lines = ["#.##.", "####.", ".#.##", "#####"]
+    board = BitBoard(4, 5)
+    bits = board.from_lines(lines, "#")
+
+    for directions, planes in (
+        (None, board.neighbor_counts(bits)),
+        (DIRECTIONS_4, board.neighbor_counts(bits, DIRECTIONS_4)),
+    ):
+        if directions is None:
+            directions = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+        for y in range(4):
+            for x in range(5):
+                expected = sum(
+                    0 <= y + dy < 4 and 0 <= x + dx < 5 and lines[y + dy][x + dx] == "#"
+                    for dy, dx in directions
+                )
+                assert _count(planes, board, y, x) == expected
+                for k in range(10):
+                    assert bool(board.at_least(planes, k) & board.bit(y, x)) == (expected >= k)
+
+
+def test_run_until_fixpoint_counts_generations():
+    board = BitBoard(1, 5)
+    bits = board.from_lines(["#####"], "#")
+
+    # peel the ends of a line one cell per side at a time
+    final, generations = run_until_fixpoint(bits, lambda b: b & board.shift(b, 0, 1) & board.shift(b, 0, -1))
+
+    assert final == 0
+    assert generations == 3
+
+
+def test_full_mask_covers_real_cells_only():
+    for height, width, guard in ((3, 2, 2), (1, 5, 1), (4, 1, 3), (0, 3, 1)):
+        board = BitBoard(height, width, guard)
+        expected = sum(((1 << width) - 1) << (y * board.stride) for y in range(height))
+        assert board.full == expected
+        assert popcount(board.full) == height * width
@@ -0,0 +1,63 @@
+import os
+
+from aoc import cache
+from aoc.cache import AnswerCache, code_hash
+
+
+def write_input(root, text):
+    path = root / "aoc2024" / "day1.txt"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_cache_hit_and_input_invalidation(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_INPUT_DIR", str(tmp_path / "inputs"))
+    write_input(tmp_path / "inputs", "3   4\n4   3")
+    cache = AnswerCache(root=tmp_path / "cache")
+
+    assert cache.get(2024, 1, 1) is None
+    cache.put(2024, 1, 1, "2")
+    assert cache.get(2024, 1, 1) == "2"
+    assert cache.get(2024, 1, 2) is None
+
+    write_input(tmp_path / "inputs", "1   1")
+    assert cache.get(2024, 1, 1) is None
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_refresh_ignores_existing_entries(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_INPUT_DIR", str(tmp_path / "inputs"))
+    write_input(tmp_path / "inputs", "3   4")
+    AnswerCache(root=tmp_path / "cache").put(2024, 1, 1, "1")
+
+    assert AnswerCache(root=tmp_path / "cache", refresh=True).get(2024, 1, 1) is None
+
+
+def test_lru_eviction(tmp_path):
+    cache = AnswerCache(root=tmp_path, max_bytes=25)
+    for i, name in enumerate(("old", "used", "new")):
+        path = tmp_path / f"{name}.json"
+        path.write_text("x" * 10)
+        os.utime(path, (i, i))
+    os.utime(tmp_path / "used.json", (10, 10))
+
+    removed = cache.evict()
+
+    assert [p.stem for p in removed] == ["old"]
+
+
+def test_code_hash_follows_aoc_dependencies(tmp_path, monkeypatch):
+    # day04 imports aoc.utils.bitboard, which imports aoc.utils.grid; every day
+    # imports aoc.runner, which imports aoc.io relatively
+    real = cache._source_path
+    copies = {}
+    for name in ("aoc.utils.grid", "aoc.io"):
+        copies[name] = tmp_path / f"{name}.py"
+        copies[name].write_text(real(name).read_text(encoding="utf-8"), encoding="utf-8")
+    monkeypatch.setattr(cache, "_source_path", lambda name: copies.get(name) or real(name))
+
+    for name, copy in copies.items():
+        before = code_hash("aoc.year2024.day04")
+        copy.write_text(copy.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+        assert code_hash("aoc.year2024.day04") != before, name
+    assert code_hash("aoc.year2024.day99") is None
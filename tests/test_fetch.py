@@ -0,0 +1,83 @@
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from aoc import fetch, io
+from aoc.io import input_path
+
+
+class FakeAoC(BaseHTTPRequestHandler):
+    """Serve /YEAR/day/DAY/input; day 2 fails once with 503, day 3 is a 404."""
+
+    attempts = {}
+
+    def do_GET(self):
+        _, year, _, day, _ = self.path.split("/")
+        count = FakeAoC.attempts[int(day)] = FakeAoC.attempts.get(int(day), 0) + 1
+        if "session=secret" not in self.headers.get("Cookie", ""):
+            self.send_response(400)
+        elif day == "3" or (day == "2" and count == 1):
+            self.send_response(404 if day == "3" else 503)
+        else:
+            body = f"input {year} {day}\n".encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FakeAoC)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    FakeAoC.attempts = {}
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_fetch_inputs(server, tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_INPUT_DIR", str(tmp_path))
+    input_path(2024, 4).parent.mkdir(parents=True)
+    input_path(2024, 4).write_text("already here")
+
+    results = fetch.fetch_inputs(
+        2024, [1, 2, 3, 4], concurrency=3, rate=0, backoff=0.01,
+        base_url=server, session_token="secret",
+    )
+
+    assert [(r.day, r.status, r.attempts) for r in results] == [
+        (1, "OK", 1), (2, "OK", 2), (3, "FAILED", 1), (4, "SKIPPED", 0),
+    ]
+    assert input_path(2024, 1).read_text() == "input 2024 1"
+    assert not input_path(2024, 3).exists()
+    assert list(tmp_path.rglob("*.part")) == []
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+def test_write_atomic_uses_umask_mode(tmp_path):
+    dest = tmp_path / "input.txt"
+    old = os.umask(0o027)
+    try:
+        io.write_atomic(dest, "data")
+    finally:
+        os.umask(old)
+    assert dest.read_text() == "data"
+    assert dest.stat().st_mode & 0o777 == 0o640
+
+
+def test_rate_limiter_spaces_out_calls():
+    limiter = fetch.RateLimiter(rate=50)
+    t0 = fetch.time.monotonic()
+    for _ in range(5):
+        limiter.wait()
+    assert fetch.time.monotonic() - t0 >= 4 / 50 * 0.9
@@ -0,0 +1,85 @@
+import pytest
+
+from aoc.utils.grid import DIRECTIONS_4, get, neighbors8, in_bounds
+
+np = pytest.importorskip("numpy")
+from aoc.utils.grid import Grid  # noqa: E402
+
+
+EXAMPLE = """\
+..@@.
+@@@.@
+.@...
+"""
+
+
+def slow_neighbor_count(lines, ch, y, x):
+    h, w = len(lines), len(lines[0])
+    return sum(
+        1 for yy, xx in neighbors8(y, x)
+        if in_bounds(yy, xx, h, w) and lines[yy][xx] == ch
+    )
+
+
+def test_grid_behaves_like_list_of_str():
+    grid = Grid.from_raw(EXAMPLE)
+    assert (len(grid), len(grid[0])) == (3, 5)
+    assert grid[1] == "@@@.@"
+    assert get(grid, 0, 2) == grid.get(0, 2) == "@"
+    assert grid.to_lines() == EXAMPLE.splitlines()
+
+
+def test_mask_and_find():
+    grid = Grid.from_raw(EXAMPLE)
+    assert grid.mask("@").sum() == 7
+    assert grid.mask("@.").all()
+    assert grid.find("@")[:3] == [(0, 2), (0, 3), (1, 0)]
+
+
+def test_shifted():
+    grid = Grid.from_raw(EXAMPLE)
+    right = grid.shifted(grid.cells, 0, 1, fill=ord("#"))
+    assert right[0].tobytes() == b".@@.#"
+    up = grid.shifted(grid.cells, -1, 0, fill=ord("#"))
+    assert up[0].tobytes() == b"#####"
+    assert up[1].tobytes() == b"..@@."
+
+
+def test_neighbor_count_matches_per_cell_helpers():
+    grid = Grid.from_raw(EXAMPLE)
+    lines = grid.to_lines()
+    counts = grid.neighbor_count(grid.mask("@"))
+    for y in range(grid.height):
+        for x in range(grid.width):
+            assert counts[y, x] == slow_neighbor_count(lines, "@", y, x)
+
+    counts4 = grid.neighbor_count(grid.mask("@"), DIRECTIONS_4)
+    assert counts4[1, 1] == 3
+
+
+def test_flat_grid_indices_and_offsets():
+    from aoc.utils.grid import SENTINEL, FlatGrid
+
+    grid = FlatGrid.from_raw(EXAMPLE)
+    assert (grid.height, grid.width, grid.stride) == (3, 5, 7)
+    assert grid.to_lines() == EXAMPLE.splitlines()
+
+    i = grid.index(1, 0)
+    assert grid.coords(i) == (1, 0)
+    assert grid.get(i) == "@"
+    # left of (1, 0) is the border
+    assert grid.cells[i + grid.offset(0, -1)] == SENTINEL
+    assert not grid.inside(i + grid.offset(0, -1))
+    assert sum(grid.cells[i + o] == ord("@") for o in grid.offsets8) == 2
+
+    assert [grid.coords(i) for i in grid.find("@")][:3] == [(0, 2), (0, 3), (1, 0)]
+    assert len(list(grid.indices())) == 15
+
+
+def test_flat_grid_wider_border():
+    from aoc.utils.grid import SENTINEL, FlatGrid
+
+    grid = FlatGrid(["ab", "cd"], pad=3)
+    corner = grid.index(0, 0)
+    assert grid.cells[corner + 3 * grid.offset(-1, -1)] == SENTINEL
+    assert grid.get(corner + grid.offsets4[2]) == "c"  # down
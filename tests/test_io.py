@@ -0,0 +1,75 @@
+import stat
+import sys
+import types
+
+import pytest
+
+from aoc import io
+
+
+class Cookie:
+    def __init__(self, name, value):
+        self.name, self.value = name, value
+
+
+@pytest.fixture
+def browsers(monkeypatch, tmp_path):
+    """Fake browser_cookie3 where only firefox holds a session cookie."""
+    calls = []
+
+    def loader(name, cookies):
+        def load(domain_name):
+            calls.append(name)
+            return cookies
+        return load
+
+    fake = types.ModuleType("browser_cookie3")
+    for name in io.DEFAULT_BROWSERS:
+        cookies = [Cookie("session", "tok")] if name == "firefox" else []
+        setattr(fake, name, loader(name, cookies))
+    monkeypatch.setitem(sys.modules, "browser_cookie3", fake)
+    monkeypatch.setenv("AOC_SESSION_CACHE", str(tmp_path / "session.json"))
+    monkeypatch.delenv("AOC_SESSION_CACHE_TTL", raising=False)
+    monkeypatch.delenv("AOC_COOKIE_BROWSERS", raising=False)
+    io.clear_session_token_cache()
+    yield calls
+    io.clear_session_token_cache()
+
+
+def test_token_is_resolved_once_per_process(browsers):
+    assert io.get_session_token() == "tok"
+    assert io.get_session_token() == "tok"
+    assert browsers == ["brave", "chrome", "firefox"]
+
+
+def test_last_successful_browser_is_tried_first(browsers):
+    io.get_session_token()
+    io.clear_session_token_cache()
+    browsers.clear()
+
+    assert io.get_session_token() == "tok"
+    assert browsers == ["firefox"]
+    assert "token" not in io._read_session_cache()
+
+
+def test_browser_order_from_environment(browsers, monkeypatch):
+    monkeypatch.setenv("AOC_COOKIE_BROWSERS", "edge, firefox")
+    assert io.get_session_token() == "tok"
+    assert browsers == ["edge", "firefox"]
+
+
+def test_disk_cache_with_ttl(browsers, monkeypatch, tmp_path):
+    monkeypatch.setenv("AOC_SESSION_CACHE_TTL", "3600")
+    io.get_session_token()
+    io._resolved_token = None
+    browsers.clear()
+
+    assert io.get_session_token() == "tok"
+    assert browsers == []
+    mode = stat.S_IMODE((tmp_path / "session.json").stat().st_mode)
+    assert mode == 0o600
+
+    monkeypatch.setenv("AOC_SESSION_CACHE_TTL", "-1")
+    io._resolved_token = None
+    io.get_session_token()
+    assert browsers == ["firefox"]
@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+from aoc import isolation
+from aoc.isolation import Limits, Task, TaskResult, WorkerPool
+
+
+def fake_execute(task):
+    if task.day == 1:
+        return TaskResult(task, "OK", str(os.getpid()), 0.0, 0.0)
+    if task.day == 2:
+        try:
+            bytearray(1 << 33)
+        except MemoryError:
+            return TaskResult(task, "OOM", "OOM (MemoryError)", 0.0, 0.0)
+    if task.day == 3:
+        while True:
+            pass
+    return TaskResult(task, "OK", "unreachable", 0.0, 0.0)
+
+
+def test_workers_are_reused(monkeypatch):
+    monkeypatch.setattr(isolation, "execute_task", fake_execute)
+    with WorkerPool(1) as pool:
+        pids = {r.answer for r in pool.run([Task(2000, 1, 1), Task(2000, 1, 2), Task(2000, 1, 1)])}
+    assert len(pids) == 1
+
+
+@pytest.mark.skipif(isolation.resource is None, reason="needs the resource module")
+def test_memory_and_cpu_limits(monkeypatch):
+    monkeypatch.setattr(isolation, "execute_task", fake_execute)
+    limits = Limits(timeout=10, cpu=1, memory=1 << 32)
+    with WorkerPool(2, limits) as pool:
+        results = {r.task.day: r for r in pool.run([Task(2000, 2, 1), Task(2000, 3, 1), Task(2000, 1, 1)])}
+
+    assert results[2].status == "OOM"
+    assert results[3].status == "TIMEOUT" and "CPU" in results[3].answer
+    assert results[1].status == "OK"
+
+
+@pytest.mark.skipif(isolation.resource is None, reason="needs the resource module")
+def test_cpu_time_is_measured_under_cpu_limit(monkeypatch):
+    class Burn:
+        __doc__ = None
+
+        @staticmethod
+        def solve_part1(raw):
+            return sum(range(50_000))
+
+    monkeypatch.setattr(isolation, "import_module", lambda name: Burn)
+    monkeypatch.setattr(isolation, "load_input", lambda year, day: "input")
+    with WorkerPool(1, Limits(cpu=5)) as pool:
+        results = list(pool.run([Task(2000, 1, 1)] * 3))
+
+    assert [r.status for r in results] == ["OK"] * 3
+    assert all(r.cpu > 0 for r in results)
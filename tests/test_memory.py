@@ -0,0 +1,45 @@
+from aoc.memory import PartMemory, format_bytes, trace_call
+
+
+def build_and_drop(n):
+    data = [str(i) for i in range(n)]
+    return len(data)
+
+
+def test_trace_call_reports_peak_of_freed_data():
+    result, usage = trace_call(build_and_drop, 20_000)
+
+    assert result == 20_000
+    assert usage.peak > 20_000 * 40  # each small str is ~50 bytes
+    assert usage.blocks >= 20_000 * 0.8
+
+
+def test_part_memory_top_sites():
+    memory = PartMemory(top=1)
+    memory.wrap("Part 1", build_and_drop)(20_000)
+
+    (site,) = memory.top_sites("Part 1")
+    assert site.traceback[0].filename == __file__
+    assert memory.columns("Part 2") == ("-", "-")
+
+
+def test_format_bytes():
+    assert format_bytes(512) == "512 B"
+    assert format_bytes(3 * 1024 * 1024) == "3.0 MiB"
+
+
+def test_run_day_shows_parse_memory_apart_from_answers(tmp_path, monkeypatch, capsys):
+    from aoc.cli import run_day
+    from aoc.io import input_path
+
+    monkeypatch.setenv("AOC_INPUT_DIR", str(tmp_path))
+    input_path(2025, 1).parent.mkdir(parents=True)
+    input_path(2025, 1).write_text("L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82")
+
+    run_day(2025, 1, mem_top=0)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert "Part 1: 3" in lines and "Part 2: 6" in lines
+    assert [line.split("|")[1].strip() for line in lines if line.startswith("| ")] == [
+        "Step", "Parse", "Part 1", "Part 2",
+    ]
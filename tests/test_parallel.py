@@ -0,0 +1,25 @@
+import os
+import time
+
+from aoc import isolation, parallel
+from aoc.parallel import Task, TaskResult
+
+
+def fake_execute(task):
+    if task.day == 2:
+        os._exit(3)
+    if task.day == 3:
+        time.sleep(30)
+    return TaskResult(task, "OK", str(task.day * 10 + task.part), 0.0, 0.0)
+
+
+def test_run_tasks_isolates_crash_and_timeout(monkeypatch):
+    monkeypatch.setattr(isolation, "execute_task", fake_execute)
+    tasks = [Task(2000, day, 1) for day in (1, 2, 3, 4)]
+
+    results = {r.task.day: r for r in parallel.run_tasks(tasks, jobs=4, timeout=1)}
+
+    assert results[1].status == "OK" and results[1].answer == "11"
+    assert results[2].status == "CRASH"
+    assert results[3].status == "TIMEOUT"
+    assert results[4].status == "OK" and results[4].answer == "41"
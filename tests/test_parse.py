@@ -0,0 +1,35 @@
+from array import array
+
+import pytest
+
+from aoc.utils.parse import ints, ints_matrix, ints_per_line
+
+
+def test_ints_signs_and_separators():
+    assert ints("1,2 -3\n4") == array("q", [1, 2, -3, 4])
+    assert ints("3-5,10-12") == array("q", [3, 5, 10, 12])
+    assert list(ints("a - b --7 x=-2, 4-")) == [-7, -2, 4]
+    assert list(ints("x=-3..-1", signed=False)) == [3, 1]
+
+
+def test_ints_strict_separator():
+    assert list(ints("1, -2,3", sep=",")) == [1, -2, 3]
+    with pytest.raises(ValueError):
+        ints("1,x", sep=",")
+
+
+def test_ints_per_line_skips_blank_lines():
+    assert ints_per_line("1 2\n\n3 -4 5\r\n") == [array("q", [1, 2]), array("q", [3, -4, 5])]
+
+
+def test_numpy_results_match():
+    np = pytest.importorskip("numpy")
+    raw = "p=-1,2 v=3,-4\np=10-20 v=-5,6\n--7 - 8-"
+    assert ints(raw, numpy=True).tolist() == list(ints(raw))
+    assert ints(raw, numpy=True).dtype == np.int64
+    assert ints("", numpy=True).tolist() == []
+
+    matrix = ints_matrix("1,2,3\n4,5,6\n", cols=3)
+    assert matrix.shape == (2, 3) and matrix[1].tolist() == [4, 5, 6]
+    with pytest.raises(ValueError):
+        ints_matrix("1,2,3", cols=2)
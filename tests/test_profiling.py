@@ -0,0 +1,32 @@
+import cProfile
+import pstats
+
+from aoc.profiling import PartProfiler, collapsed_stacks
+
+
+def leaf(n):
+    return sum(i * i for i in range(n))
+
+
+def root():
+    return leaf(20000) + leaf(10000)
+
+
+def test_collapsed_stacks_follow_call_chain():
+    profile = cProfile.Profile()
+    profile.runcall(root)
+    lines = collapsed_stacks(pstats.Stats(profile))
+
+    stacks = {line.rsplit(" ", 1)[0] for line in lines}
+    assert any(s.startswith("root (") and ";leaf (" in s for s in stacks)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_part_profiler_writes_files(tmp_path, capsys):
+    profiler = PartProfiler("2000_day01", out_dir=tmp_path, top=3)
+    assert profiler.wrap("Part 1", leaf)(100) == leaf(100)
+    profiler.report()
+
+    assert (tmp_path / "2000_day01_part1.pstats").exists()
+    assert (tmp_path / "2000_day01_part1.collapsed").exists()
+    assert "Part 1: top 3 functions by self time" in capsys.readouterr().out
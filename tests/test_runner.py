@@ -0,0 +1,34 @@
+from aoc.runner import solve_parts
+from aoc.utils.solver import takes_parsed
+
+
+PARSE_CALLS = []
+
+
+def parse(raw):
+    PARSE_CALLS.append(raw)
+    return [int(x) for x in raw.split()]
+
+
+@takes_parsed(mutates=True)
+def solve_part1(numbers):
+    numbers.clear()
+    return 0
+
+
+@takes_parsed
+def solve_part2(numbers):
+    return sum(numbers)
+
+
+def test_parsed_solvers_still_accept_raw_input():
+    assert solve_part2("1 2 3") == 6
+
+
+def test_solve_parts_parses_once_and_protects_shared_input():
+    PARSE_CALLS.clear()
+    rows = solve_parts(globals(), "1 2 3")
+
+    assert [label for label, _, _ in rows] == ["Parse", "Part 1", "Part 2"]
+    assert rows[2][1] == "6"
+    assert PARSE_CALLS == ["1 2 3"]
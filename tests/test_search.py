@@ -0,0 +1,60 @@
+from aoc.utils.grid import DIRECTIONS_8, FlatGrid
+from aoc.utils.search import AdjacencyGraph, GridGraph, astar, bfs, bfs_01, dijkstra
+
+
+MAZE = [
+    "..#....",
+    ".##.##.",
+    "...#...",
+    ".#...#.",
+    "...#...",
+]
+
+
+def test_bfs_on_grid_with_path():
+    graph = GridGraph(FlatGrid(MAZE))
+    result = bfs(graph, (0, 0), goal=(0, 6))
+
+    assert result.found
+    assert result.distance((0, 6)) == 12
+    path = result.path()
+    assert path[0] == (0, 0) and path[-1] == (0, 6) and len(path) == 13
+    assert all(abs(y1 - y2) + abs(x1 - x2) == 1 for (y1, x1), (y2, x2) in zip(path, path[1:]))
+    assert all(MAZE[y][x] == "." for y, x in path)
+
+
+def test_bfs_without_goal_and_unreachable_cells():
+    graph = GridGraph(FlatGrid(["..#.", "..#."]))
+    result = bfs(graph, (0, 0))
+
+    assert not result.found
+    assert result.distance((1, 1)) == 2
+    assert result.distance((0, 3)) is None
+    assert result.path((0, 3)) == []
+
+
+def test_bfs_eight_directions():
+    graph = GridGraph(FlatGrid(MAZE), directions=DIRECTIONS_8)
+    assert bfs(graph, (0, 0), goal=(4, 6)).distance((4, 6)) == 7
+
+
+def test_weighted_grid_searches_agree():
+    lines = ["1911", "1919", "1119"]
+    graph = GridGraph(FlatGrid(lines), walls="", costs={str(d): d for d in range(10)})
+
+    expected = 4  # down the left column, then along the bottom row
+    assert dijkstra(graph, (0, 0), goal=(2, 2)).distance((2, 2)) == expected
+    assert astar(graph, (0, 0), (2, 2), graph.manhattan((2, 2))).distance((2, 2)) == expected
+    assert dijkstra(graph, (0, 0)).distance((0, 3)) == 7
+
+
+def test_adjacency_graph_searches():
+    graph = AdjacencyGraph({"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": ["e"]})
+    result = bfs(graph, "a", goal="e")
+    assert result.distance("e") == 3
+    assert result.path() in (["a", "b", "d", "e"], ["a", "c", "d", "e"])
+
+    weighted = AdjacencyGraph({"a": {"b": 1, "c": 0}, "b": {"d": 0}, "c": {"b": 0, "d": 1}})
+    assert bfs_01(weighted, "a").distance("d") == 0
+    assert bfs_01(weighted, "a", goal="d").path() == ["a", "c", "b", "d"]
+    assert dijkstra(weighted, "a").distance("d") == 0
@@ -0,0 +1,36 @@
+import pytest
+
+from aoc import cli, startup
+
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _hashlib
+import time:       300 |        420 |   aoc.cache
+import time:        50 |         50 |   aoc.runner
+import time:       200 |        670 | aoc.cli
+"""
+
+
+def test_parse_importtime():
+    timings = startup.parse_importtime(IMPORTTIME_OUTPUT)
+    assert timings[0] == startup.ImportTiming("_hashlib", 120, 120, 2)
+    assert startup.total_import_us(timings) == 670
+
+
+def test_cli_startup_does_not_load_heavy_modules():
+    # which modules get imported, not how long it takes: wall time flakes on loaded machines
+    timings = startup.measure_imports("aoc.cli")
+    imported = {t.module.split(".")[0] for t in timings}
+    assert startup.eager_lazy_modules(timings) == []
+    assert not imported & {"requests", "numpy", "browser_cookie3"}
+    assert "aoc" in imported
+
+
+def test_explicit_zero_startup_budget_is_kept(monkeypatch):
+    budgets = []
+    monkeypatch.setattr(startup, "report", lambda budget_ms: budgets.append(budget_ms) or 0)
+    monkeypatch.setattr(cli.sys, "argv", ["aoc", "--startup-report", "--startup-budget", "0"])
+    with pytest.raises(SystemExit):
+        cli.main()
+    assert budgets == [0.0]
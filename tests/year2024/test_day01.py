@@ -25,3 +25,22 @@ def test_part2_example():
     result = day01.solve_part2(EXAMPLE_INPUT)
     # TODO: replace with the expected value from the problem example
     assert result == 31
+
+
+def test_similarity_counting_and_sorted_paths():
+    import numpy as np
+
+    pool = np.array([5, 3, 5, 10**9, 5])
+    values = np.array([5, 4, 10**9, 3])
+    assert day01.similarity(values, pool) == 5 * 3 + 10**9 + 3
+    assert day01.similarity(values[:2], pool[:3]) == 10
+    assert day01.similarity(values[:0], pool) == 0
+
+
+def test_similarity_does_not_overflow_int64():
+    import numpy as np
+
+    big = 3 * 10**18
+    pool = np.array([big] * 4)
+    values = np.array([big, big])
+    assert day01.similarity(values, pool) == 2 * 4 * big
@@ -24,3 +24,32 @@ def test_part1_example():
 def test_part2_example():
     result = day02.solve_part2(EXAMPLE_INPUT)
     assert result == 4
+
+
+def _brute_force_dampener(report):
+    return any(day02.is_valid_report(report[:i] + report[i + 1:]) for i in range(len(report))) \
+        or day02.is_valid_report(report)
+
+
+def test_dampener_and_batch_match_brute_force():
+    import random
+
+    import numpy as np
+
+    rng = random.Random(4)
+    for n in (1, 2, 3, 4, 7):
+        reports = []
+        for _ in range(300):
+            level, sign = rng.randint(0, 20), rng.choice((1, -1))
+            report = []
+            for _ in range(n):
+                report.append(level)
+                level += sign * rng.choice((1, 2, 3, 3, 0, 4, -1))
+            reports.append(report)
+
+        expected = [_brute_force_dampener(r) for r in reports]
+        assert [day02.is_valid_with_dampener(r) for r in reports] == expected
+        assert day02.batch_valid(np.array(reports).reshape(len(reports), n), dampener=True).tolist() == expected
+        assert day02.batch_valid(np.array(reports).reshape(len(reports), n)).tolist() == [
+            day02.is_valid_report(r) for r in reports
+        ]
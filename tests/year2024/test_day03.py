@@ -19,3 +19,15 @@ def test_part1_example():
 def test_part2_example():
     result = day03.solve_part2("xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))")
     assert result == 48
+
+
+def test_scan_carries_tokens_and_state_across_chunks(tmp_path):
+    memory = "xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))mul(123,\n456)"
+    for size in range(1, 15):
+        chunks = [memory[i:i + size] for i in range(0, len(memory), size)]
+        assert day03.scan(chunks) == 161 + 123 * 456
+        assert day03.scan(chunks, controlled=True) == 48 + 123 * 456
+
+    path = tmp_path / "dump.txt"
+    path.write_text(memory)
+    assert day03.solve_file(path, controlled=True, chunk_size=3) == 48 + 123 * 456
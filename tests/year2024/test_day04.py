@@ -1,3 +1,5 @@
+import pytest
+
 from aoc.year2024 import day04
 
 
@@ -28,3 +30,22 @@ def test_part1_example():
 def test_part2_example():
     result = day04.solve_part2(EXAMPLE_INPUT)
     assert result == 9
+
+
+def test_count_word_and_pattern_parameters():
+    grid = ["ABC", "BBB", "CBA"]
+    assert day04.count_word(grid, "AB") == 6
+    assert day04.count_word(grid, "ABC") == 4
+    assert day04.count_word(["AB"], "A") == 1
+    assert day04.count_word(grid, "B") == 5
+    with pytest.raises(ValueError):
+        day04.count_word(["X"], "")
+    assert day04.count_pattern(grid, ("A.", ".B")) == 2
+    assert day04.count_pattern(grid, ("A.", ".B"), rotations=False) == 1
+
+
+def test_count_pattern_non_square_counts_each_position_once():
+    assert day04.count_pattern([".A.", "..."], [".A"]) == 1
+    assert day04.count_pattern(["AB.", "B.."], ["AB"]) == 1
+    assert day04.count_pattern(["AB.", "B.."], ["AB"], rotations=False) == 1
+    assert day04.count_pattern(["BA", ".."], ["AB"]) == 1
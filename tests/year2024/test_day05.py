@@ -47,3 +47,22 @@ def test_part1_example():
 def test_part2_example():
     result = day05.solve_part2(EXAMPLE_INPUT)
     assert result == 123
+
+
+def test_fix_update_long_update_and_cycle():
+    pages = list(range(2000))
+    index = day05.build_rule_index([(a, a + 1) for a in pages[:-1]])
+    shuffled = pages[::-1]
+
+    assert not day05.is_valid_update(shuffled, index)
+    assert day05.fix_update(shuffled, index) == pages
+    assert day05.is_valid_update(pages, index)
+
+    cyclic = day05.build_rule_index([(1, 2), (2, 3), (3, 1)])
+    assert day05.fix_update([3, 2, 1], cyclic) is None
+
+
+def test_rule_list_still_accepted():
+    rules, updates = day05.parse(EXAMPLE_INPUT)
+    assert [day05.is_valid_update(u, rules) for u in updates] == [True, True, True, False, False, False]
+    assert day05.fix_update([97, 13, 75, 29, 47], rules) == [97, 75, 47, 29, 13]
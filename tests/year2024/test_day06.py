@@ -28,3 +28,66 @@ def test_part1_example():
 def test_part2_example():
     result = day06.solve_part2(EXAMPLE_INPUT)
     assert result == 6
+
+
+def test_part2_parallel_matches_serial():
+    assert day06.solve_part2(EXAMPLE_INPUT, workers=3) == 6
+
+
+def _loops_with_obstacle(grid, start_y, start_x, obstacle):
+    """Reference check: walk the obstacle index with `obstacle` inserted."""
+    from bisect import insort
+
+    h, w = len(grid), len(grid[0])
+    rows, cols = day06.build_obstacle_index(grid)
+    oy, ox = obstacle
+    insort(rows[oy], ox)
+    insort(cols[ox], oy)
+    y, x, d = start_y, start_x, day06.DIR_UP
+    seen = {(y, x, d)}
+    while 0 <= y < h and 0 <= x < w:
+        y, x, d = day06.move_with_index(y, x, d, rows, cols, h, w)
+        if (y, x, d) in seen:
+            return True
+        seen.add((y, x, d))
+    return False
+
+
+def test_jump_table_matches_index_walk():
+    import random
+
+    rng = random.Random(7)
+    lines = [[("#" if rng.random() < 0.08 else ".") for _ in range(40)] for _ in range(30)]
+    lines[20][17] = "^"
+    grid, (start_y, start_x) = day06.parse("\n".join("".join(row) for row in lines))
+    table = day06.JumpTable(grid)
+    before = table.jump.tobytes()
+
+    for oy, ox, run in day06.first_visits(grid, start_y, start_x):
+        resume = table.state(*run)
+        expected = _loops_with_obstacle(grid, start_y, start_x, (oy, ox))
+        assert table.loops_with(oy, ox, resume) == expected
+        assert table.loops_with(oy, ox, table.state(start_y, start_x, day06.DIR_UP)) == expected
+    assert table.jump.tobytes() == before
+
+
+def test_get_path_and_first_visits_match_step_by_step_walk():
+    grid, (y, x) = day06.parse(EXAMPLE_INPUT)
+    h, w = len(grid), len(grid[0])
+    order, d = [(y, x)], 0
+    moves = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+    while True:
+        ny, nx = y + moves[d][0], x + moves[d][1]
+        if not (0 <= ny < h and 0 <= nx < w):
+            break
+        if grid[ny][nx] == "#":
+            d = (d + 1) % 4
+            continue
+        y, x = ny, nx
+        if (y, x) not in order:
+            order.append((y, x))
+
+    visited = day06.visited_bitmap(grid, *order[0])
+    assert {divmod(i, w) for i, v in enumerate(visited) if v} == set(order)
+    assert day06.get_path(grid, *order[0]) == set(order)
+    assert [(cy, cx) for cy, cx, _ in day06.first_visits(grid, *order[0])] == order[1:]
@@ -17,8 +17,7 @@ L82
 
 def test_parse_example():
     data = day01.parse(EXAMPLE_INPUT)
-    # TODO: adjust expected structure
-    assert isinstance(data, list)
+    assert data.tolist() == [-68, -30, 48, -5, 60, -55, -1, -99, 14, -82]
 
 
 def test_part1_example():
@@ -29,3 +28,25 @@ def test_part1_example():
 def test_part2_example():
     result = day01.solve_part2(EXAMPLE_INPUT)
     assert result == 6
+
+
+def test_dial_size_and_start_parameters():
+    assert day01.solve_part1("R5\nL3\nR8", size=10, start=0) == 1
+    assert day01.solve_part2("R25\nL30\nL10", size=10, start=5) == 3 + 3 + 1
+
+
+def test_matches_click_by_click_simulation():
+    import random
+
+    rng = random.Random(25)
+    lines = [f"{rng.choice('LR')}{rng.randint(0, 350)}" for _ in range(500)]
+    pos, landed, passed = 50, 0, 0
+    for line in lines:
+        step = -1 if line[0] == "L" else 1
+        for _ in range(int(line[1:])):
+            pos = (pos + step) % 100
+            passed += pos == 0
+        landed += pos == 0
+    raw = "\n".join(lines)
+    assert day01.solve_part1(raw) == landed
+    assert day01.solve_part2(raw) == passed
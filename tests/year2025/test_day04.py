@@ -28,3 +28,28 @@ def test_part1_example():
 def test_part2_example():
     result = day04.solve_part2(EXAMPLE_INPUT)
     assert result == 43
+
+
+def test_removal_waves_example():
+    waves = list(day04.removal_waves(day04.parse(EXAMPLE_INPUT)))
+    assert len(waves[0]) == 13
+    assert sum(len(wave) for wave in waves) == 43
+
+
+def test_removal_waves_match_generations():
+    from aoc.utils.bitboard import BitBoard
+
+    rolls, (w, h) = day04.parse(EXAMPLE_INPUT)
+    board = BitBoard(h, w)
+    bits = board.from_lines(rolls, '@')
+    for wave in day04.removal_waves((rolls, (w, h))):
+        nxt = bits & board.at_least(board.neighbor_counts(bits), 4)
+        assert sorted(wave) == list(board.cells(bits & ~nxt))
+        bits = nxt
+
+
+def test_part2_hands_long_peels_to_removal_waves():
+    # a 2-wide strip only loses its ends each wave
+    raw = "\n".join(["." * 202, "." + "@" * 200 + ".", "." + "@" * 200 + ".", "." * 202])
+    assert len(list(day04.removal_waves(day04.parse(raw)))) > day04.BITBOARD_GENERATIONS
+    assert day04.solve_part2(raw) == 400